@@ -1,7 +1,7 @@
 import asyncio
 import logging
 import sys
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, LinkPreviewOptions
 from telegram.ext import (
     Application,
     CommandHandler,
@@ -9,6 +9,7 @@ from telegram.ext import (
     MessageHandler,
     filters,
     ContextTypes,
+    Defaults,
 )
 from telegram.constants import ParseMode
 from dotenv import load_dotenv
@@ -21,6 +22,8 @@ from features.trending_repos import trending_handler
 from admin import ADMIN_GITHUB_USERNAME
 from admin.admin_profile import show_admin_profile
 from admin.admin_repository import show_admin_repository
+from utils.git_api import close_github_session
+from utils.rate_limit import edit_limiter
 
 # Import README handlers for pagination - REMOVED (not present in handlers/readme.py)
 # from handlers.readme import handle_readme_navigation, handle_readme_pages
@@ -323,14 +326,30 @@ async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE):
             pass
 
 
+async def post_shutdown(application: Application):
+    """Release shared resources once the bot has stopped"""
+    await close_github_session()
+
+
 def main():
     """Start the bot"""
     if not BOT_TOKEN:
         print("❌ BOT_TOKEN not found in .env file!")
         return
 
-    # Create application
-    app = Application.builder().token(BOT_TOKEN).build()
+    # Create application; messages are Markdown without link previews unless a call says otherwise
+    defaults = Defaults(
+        parse_mode=ParseMode.MARKDOWN,
+        link_preview_options=LinkPreviewOptions(is_disabled=True),
+    )
+    app = (
+        Application.builder()
+        .token(BOT_TOKEN)
+        .defaults(defaults)
+        .rate_limiter(edit_limiter)  # Keeps every message edit under Telegram's flood limits
+        .post_shutdown(post_shutdown)
+        .build()
+    )
 
     # Add error handler
     app.add_error_handler(error_handler)
@@ -56,8 +56,16 @@ class CommandRouter:
         logger.debug(f"DEBUG: handle_callback_query - Received action: {action}")
 
         try:
-            # Answer callback query immediately to remove loading indicator
-            await query.answer()
+            # Answer callback query immediately to remove loading indicator;
+            # the profile handler answers its own with a progress toast
+            is_profile_action = (
+                action.startswith("user_")
+                or action.startswith("refresh_user_")
+                or action == "back_to_profile"
+                or action.startswith("show_avatar_")
+            )
+            if not is_profile_action:
+                await query.answer()
             
             # Basic navigation with loading for heavy operations
             if action == "back_to_start":
@@ -134,12 +142,7 @@ class CommandRouter:
                     await query.answer("❌ Invalid action")
 
             # Handle profile-related actions
-            elif (
-                action.startswith("user_")
-                or action.startswith("refresh_user_")
-                or action == "back_to_profile"
-                or action.startswith("show_avatar_")
-            ):
+            elif is_profile_action:
                 logger.info(f"Routing profile action: {action}")
                 logger.debug(f"DEBUG: handle_callback_query - Routing to profile handler for action: {action}")
                 try:
@@ -126,10 +126,11 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             logger.error(f"Fallback error in start command: {fallback_error}")
             # Last resort - simple message
             simple_text = f"👋 Hello {user.first_name or 'there'}!\n\nWelcome to GitHub Explorer Bot!\n\nUse /help to get started."
+            # Sent as plain text, the user's name may contain Markdown characters
             if update.callback_query:
-                await update.callback_query.edit_message_text(simple_text)
+                await update.callback_query.edit_message_text(simple_text, parse_mode=None)
             else:
-                await update.message.reply_text(simple_text)
+                await update.message.reply_text(simple_text, parse_mode=None)
 
     # Clear any existing data
     context.user_data.clear()
@@ -1,7 +1,6 @@
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 from telegram.helpers import escape_markdown
-import aiohttp
 import asyncio
 
 # Import the loading system
@@ -44,11 +43,11 @@ class RepositoryHandler:
         )
 
         try:
-            from utils.git_api import fetch_repo_info
+            from utils.git_api import fetch_repo_info, get_github_session
             from utils.formatting import format_repo_info
 
-            async with aiohttp.ClientSession() as session:
-                repo_data = await fetch_repo_info(session, repo_name)
+            session = get_github_session()
+            repo_data = await fetch_repo_info(session, repo_name)
 
             # Stop loading animation gracefully
             if loading_task and not loading_task.done():
@@ -6,6 +6,7 @@ import asyncio
 
 # Import the loading system
 from utils.loading import show_loading, show_static_loading
+from utils.git_api import get_github_session
 
 logger = logging.getLogger(__name__)
 
@@ -80,10 +81,8 @@ class TrendingHandler:
         )
 
         try:
-            # Create session with better timeout handling
-            timeout = aiohttp.ClientTimeout(total=10, connect=5)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                repos = await self.fetch_trending_repos(session, language, time_range)
+            session = get_github_session()
+            repos = await self.fetch_trending_repos(session, language, time_range)
 
             # Stop loading animation gracefully
             if loading_task and not loading_task.done():
@@ -1,7 +1,6 @@
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 from telegram.helpers import escape_markdown
-import aiohttp
 import asyncio
 
 # Import the loading system
@@ -101,10 +100,10 @@ class UserProfileHandler:
     async def show_user_repositories(self, query, username, context, loading_task):
         """Show user's repositories with loading animation"""
         try:
-            from utils.git_api import fetch_user_repositories
+            from utils.git_api import fetch_user_repositories, get_github_session
 
-            async with aiohttp.ClientSession() as session:
-                repos = await fetch_user_repositories(session, username, limit=10)
+            session = get_github_session()
+            repos = await fetch_user_repositories(session, username, limit=10)
 
             # Stop loading animation gracefully
             if loading_task and not loading_task.done():
@@ -1,9 +1,9 @@
-import aiohttp
 import asyncio
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 from telegram.helpers import escape_markdown
-from utils.git_api import fetch_contributors
+from utils.git_api import fetch_contributors, get_github_session
+from utils.formatting import escape_markdown_cached
 
 # Import the loading system
 from utils.loading import show_loading, show_static_loading
@@ -21,7 +21,7 @@ async def handle_contributors(update: Update, context: ContextTypes.DEFAULT_TYPE
     # Show static loading first to preserve the window
     await show_static_loading(
         q.message,
-        f"👥 **{escape_markdown(repo, 2)} Contributors**",  # FIXED: Escaped repo name
+        f"👥 **{escape_markdown_cached(repo)} Contributors**",  # FIXED: Escaped repo name
         "Loading contributors",
         preserve_content=True,
         animation_type="heart",  # Heart animation for contributors
@@ -30,14 +30,13 @@ async def handle_contributors(update: Update, context: ContextTypes.DEFAULT_TYPE
     # Start animated loading
     loading_task = await show_loading(
         q.message,
-        f"👥 **{escape_markdown(repo, 2)} Contributors**",  # FIXED: Escaped repo name
+        f"👥 **{escape_markdown_cached(repo)} Contributors**",  # FIXED: Escaped repo name
         "Loading contributors",
         animation_type="heart",
     )
 
     try:
-        async with aiohttp.ClientSession() as session:
-            contributors = await fetch_contributors(session, repo)
+        contributors = await fetch_contributors(get_github_session(), repo)
 
         # Stop loading animation gracefully
         if loading_task and not loading_task.done():
@@ -91,7 +90,7 @@ async def handle_contributors(update: Update, context: ContextTypes.DEFAULT_TYPE
 
 def _build_contributors_content(contributors, repo):
     """Build the contributors content"""
-    repo_name = escape_markdown(repo, 2)
+    repo_name = escape_markdown_cached(repo)
     text = f"👥 *Top Contributors of* __{repo_name}__\n\n"
 
     # Add helpful tip
@@ -126,7 +125,7 @@ def _build_contributors_content(contributors, repo):
 
 async def _show_contributors_error(q, repo, error_type, keyboard):
     """Show contributors error with structured message"""
-    repo_escaped = escape_markdown(repo, 2)
+    repo_escaped = escape_markdown_cached(repo)
     error_text = f"👥 *{repo_escaped} Contributors*\n\n"
     error_text += f"❌ *{escape_markdown(error_type, 2)}*\n\n"
 
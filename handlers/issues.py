@@ -1,9 +1,9 @@
-import aiohttp
 import asyncio
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 from telegram.helpers import escape_markdown
-from utils.git_api import fetch_open_issues
+from utils.git_api import fetch_open_issues, get_github_session
+from utils.formatting import escape_markdown_cached
 
 # Import the loading system
 from utils.loading import show_loading, show_static_loading
@@ -36,12 +36,10 @@ async def handle_issues(update: Update, context: ContextTypes.DEFAULT_TYPE):
     )
 
     try:
-        # Add timeout to prevent hanging
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-            issues = await asyncio.wait_for(
-                fetch_open_issues(session, repo),
-                timeout=8.0  # 8 second timeout
-            )
+        issues = await asyncio.wait_for(
+            fetch_open_issues(get_github_session(), repo),
+            timeout=8.0  # 8 second timeout
+        )
 
         # Stop loading animation gracefully
         if loading_task and not loading_task.done():
@@ -119,7 +117,7 @@ async def handle_issues(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 def _build_issues_content(issues, repo):
     """Build the issues content with proper formatting"""
-    repo_name = escape_markdown(repo, 2)
+    repo_name = escape_markdown_cached(repo)
     text = f"🐛 *Open Issues in* `{repo_name}`\n\n"
 
     # Add summary info
@@ -200,7 +198,7 @@ def _calculate_time_ago(created_at):
 
 async def _show_no_issues(message, repo, keyboard):
     """Show message when no issues are found"""
-    repo_escaped = escape_markdown(repo, 2)
+    repo_escaped = escape_markdown_cached(repo)
     text = f"🐛 **{repo} Issues**\n\n"
     text += f"✅ **No Open Issues Found**\n\n"
     text += f"Great news! This repository has no open issues\\.\n\n"
@@ -5,7 +5,8 @@ from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 from telegram.helpers import escape_markdown
 from telegram.error import BadRequest
-from utils.git_api import fetch_languages
+from utils.git_api import fetch_languages, get_github_session
+from utils.formatting import escape_markdown_cached
 
 # Import the loading system
 from utils.loading import show_loading, show_static_loading
@@ -26,7 +27,7 @@ async def handle_languages(update: Update, context: ContextTypes.DEFAULT_TYPE):
     try:
         await show_static_loading(
             q.message,
-            f"💻 **{escape_markdown(repo, 2)} Languages**",
+            f"💻 **{escape_markdown_cached(repo)} Languages**",
             "Loading language data",
             preserve_content=True,
             animation_type="tech",
@@ -40,7 +41,7 @@ async def handle_languages(update: Update, context: ContextTypes.DEFAULT_TYPE):
     try:
         loading_task = await show_loading(
             q.message,
-            f"💻 **{escape_markdown(repo, 2)} Languages**",
+            f"💻 **{escape_markdown_cached(repo)} Languages**",
             "Loading language data",
             animation_type="tech",
         )
@@ -48,10 +49,7 @@ async def handle_languages(update: Update, context: ContextTypes.DEFAULT_TYPE):
         logger.warning(f"Could not start loading animation: {e}")
 
     try:
-        # Set timeout for API request
-        timeout = aiohttp.ClientTimeout(total=10)  # 10 second timeout
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            languages = await fetch_languages(session, repo)
+        languages = await fetch_languages(get_github_session(), repo)
 
         # Stop loading animation gracefully
         if loading_task and not loading_task.done():
@@ -129,7 +127,7 @@ async def handle_languages(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 def _build_languages_content(languages, repo):
     """Build the languages content with progress bars"""
-    repo_name = escape_markdown(repo, 2)
+    repo_name = escape_markdown_cached(repo)
     text = f"💻 *Programming Languages in* __{repo_name}__\n\n"
 
     # Calculate total bytes and sort languages
@@ -200,7 +198,7 @@ async def _show_timeout_error(q, repo):
         ]
     ])
 
-    repo_escaped = escape_markdown(repo, 2)
+    repo_escaped = escape_markdown_cached(repo)
     error_text = f"💻 *{repo_escaped} Languages*\n\n"
     error_text += f"⏱️ *Request Timeout*\n\n"
     error_text += f"The request took too long to complete\\.\n\n"
@@ -226,7 +224,7 @@ async def _show_network_error(q, repo):
         ]
     ])
 
-    repo_escaped = escape_markdown(repo, 2)
+    repo_escaped = escape_markdown_cached(repo)
     error_text = f"💻 *{repo_escaped} Languages*\n\n"
     error_text += f"🌐 *Network Error*\n\n"
     error_text += f"Could not connect to GitHub API\\.\n\n"
@@ -248,7 +246,7 @@ async def _show_network_error(q, repo):
 
 async def _show_no_languages(q, repo, keyboard):
     """Show message when no language data is found"""
-    repo_escaped = escape_markdown(repo, 2)
+    repo_escaped = escape_markdown_cached(repo)
     text = f"💻 *{repo_escaped} Languages*\n\n"
     text += f"❌ *No Language Data Available*\n\n"
     text += f"No programming language data found for this repository\\.\n\n"
@@ -272,7 +270,7 @@ async def _show_no_languages(q, repo, keyboard):
 
 async def _show_languages_error(q, repo, error_type, keyboard):
     """Show languages error with structured message"""
-    repo_escaped = escape_markdown(repo, 2)
+    repo_escaped = escape_markdown_cached(repo)
     error_text = f"💻 *{repo_escaped} Languages*\n\n"
     error_text += f"❌ *{escape_markdown(error_type, 2)}*\n\n"
 
@@ -1,9 +1,9 @@
-import aiohttp
 import asyncio
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 from telegram.helpers import escape_markdown
-from utils.git_api import fetch_open_prs
+from utils.git_api import fetch_open_prs, get_github_session
+from utils.formatting import escape_markdown_cached
 import logging
 
 logger = logging.getLogger(__name__)
@@ -39,8 +39,7 @@ async def handle_prs(update: Update, context: ContextTypes.DEFAULT_TYPE):
     )
 
     try:
-        async with aiohttp.ClientSession() as session:
-            prs = await fetch_open_prs(session, repo)
+        prs = await fetch_open_prs(get_github_session(), repo)
 
         # Stop loading animation gracefully
         if loading_task and not loading_task.done():
@@ -95,7 +94,7 @@ async def handle_prs(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 def _build_prs_content(prs, repo):
     """Build the pull requests content with enhanced formatting"""
-    repo_name = escape_markdown(repo, 2)
+    repo_name = escape_markdown_cached(repo)
     text = f"🔀 *Open Pull Requests in* __{repo_name}__\n\n"
 
     # Add summary info
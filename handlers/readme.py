@@ -1,15 +1,34 @@
-import aiohttp
-import asyncio
+import re
+import time
+from collections import OrderedDict
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
-from telegram.helpers import escape_markdown
-from utils.git_api import fetch_readme
+from utils.git_api import fetch_readme, get_github_session
+from utils.formatting import escape_markdown_cached, escape_markdown_v2
 
 # Import the loading system
-from utils.loading import show_loading, show_static_loading
+from utils.loading import fetch_with_loading
 
 # Constants for pagination
 PAGE_SIZE = 3000  # Characters per page (leaving room for headers/footers)
+SAFE_PAGE_SIZE = PAGE_SIZE - 500  # Fallback when Telegram rejects a page as too long
+
+# Paginated READMEs live here rather than in user_data, bounded across all users
+README_CACHE_SIZE = 200
+README_CACHE_TTL = 1800  # 30 minutes
+_readme_pages_cache = OrderedDict()
+
+# Static keyboards, built once
+_BACK_TO_REPO_BUTTON = InlineKeyboardButton("⬅️ Back to Repository", callback_data="refresh")
+_NO_README_KEYBOARD = InlineKeyboardMarkup([[_BACK_TO_REPO_BUTTON]])
+_README_ERROR_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("🔄 Try Again", callback_data="readme"), _BACK_TO_REPO_BUTTON]
+])
+_README_ACTION_ROW = (InlineKeyboardButton("🔄 Refresh", callback_data="readme"), _BACK_TO_REPO_BUTTON)
+
+# Candidate page breaks, one named group per kind
+_BREAK_RE = re.compile(r"(?P<paragraph>\n\n)|(?P<line>\n)|(?P<sentence>[.!?] )|(?P<word> )")
+_LEADING_SPACE_RE = re.compile(r"\s*")
 
 async def handle_readme(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle README display with loading animation"""
@@ -24,86 +43,52 @@ async def handle_readme(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # Reset page to 0 when loading new README
     context.user_data['readme_page'] = 0
 
-    # Show static loading first to preserve the window
-    await show_static_loading(
-        query.message,
-        f"📖 **{escape_markdown(repo, 2)} README**",
-        "Loading README file",
-        preserve_content=True,
-        animation_type="progress",
-    )
-
-    # Start animated loading
-    loading_task = await show_loading(
-        query.message,
-        f"📖 **{escape_markdown(repo, 2)} README**",
-        "Loading README file",
-        animation_type="progress",
-    )
-
     try:
-        async with aiohttp.ClientSession() as session:
-            text = await fetch_readme(session, repo)
-
-        # Stop loading animation gracefully
-        if loading_task and not loading_task.done():
-            loading_task.cancel()
-            try:
-                await loading_task
-            except asyncio.CancelledError:
-                pass
+        text = await fetch_with_loading(
+            fetch_readme(get_github_session(), repo),
+            query.message,
+            f"📖 **{escape_markdown_cached(repo)} README**",
+            "Loading README file",
+            animation_type="progress",
+        )
 
         if not text:
-            repo_escaped = escape_markdown(repo, 2)
+            repo_escaped = escape_markdown_cached(repo)
             error_text = f"📖 *{repo_escaped} README*\n\n"
             error_text += "❌ *No README Found*\n\n"
             error_text += "This repository does not have a README file\\.\n\n"
             error_text += "💡 *Tip:* A good README helps others understand your project\\!"
 
-            back_keyboard = InlineKeyboardMarkup([
-                [InlineKeyboardButton("⬅️ Back to Repository", callback_data="refresh")]
-            ])
-
             await query.edit_message_text(
                 error_text,
                 parse_mode="MarkdownV2",
-                reply_markup=back_keyboard
+                reply_markup=_NO_README_KEYBOARD
             )
             return
 
-        # Store full README in context for pagination
-        context.user_data['full_readme'] = text
+        # Escape once and store the pages in context for pagination
+        pages = _paginate_text(
+            escape_markdown_v2(text),
+            context.user_data.get('readme_page_size', PAGE_SIZE),
+        )
+        _store_readme_pages(query.from_user.id, repo, pages)
+        context.user_data['readme_total_pages'] = len(pages)
 
         # Display the first page
         await _display_readme_page(query, context, repo, 0)
 
     except Exception as e:
-        # Stop loading animation gracefully
-        if loading_task and not loading_task.done():
-            loading_task.cancel()
-            try:
-                await loading_task
-            except asyncio.CancelledError:
-                pass
-
         # Simple error message
-        repo_escaped = escape_markdown(repo, 2)
+        repo_escaped = escape_markdown_cached(repo)
         error_text = f"📖 *{repo_escaped} README*\n\n"
         error_text += "❌ *Fetch Error*\n\n"
         error_text += "Unable to fetch README file\\.\n\n"
         error_text += "💡 *Tip:* Try again in a few moments\\!"
 
-        back_keyboard = InlineKeyboardMarkup([
-            [
-                InlineKeyboardButton("🔄 Try Again", callback_data="readme"),
-                InlineKeyboardButton("⬅️ Back to Repository", callback_data="refresh")
-            ]
-        ])
-
         await query.edit_message_text(
             error_text,
             parse_mode="MarkdownV2",
-            reply_markup=back_keyboard
+            reply_markup=_README_ERROR_KEYBOARD
         )
 
 
@@ -114,10 +99,10 @@ async def handle_readme_navigation(update: Update, context: ContextTypes.DEFAULT
 
     # Get current state
     repo = context.user_data.get("current_repo")
-    full_readme = context.user_data.get("full_readme")
+    pages = _get_readme_pages(query.from_user.id, repo)
     current_page = context.user_data.get("readme_page", 0)
 
-    if not repo or not full_readme:
+    if not repo or not pages:
         await query.edit_message_text(
             "❌ _README data not found\\. Please reload the repository\\._",
             parse_mode="MarkdownV2"
@@ -140,10 +125,7 @@ async def handle_readme_navigation(update: Update, context: ContextTypes.DEFAULT
 
 async def _display_readme_page(query, context: ContextTypes.DEFAULT_TYPE, repo: str, page: int):
     """Display a specific page of the README"""
-    full_readme = context.user_data.get("full_readme", "")
-
-    # Calculate pagination
-    pages = _paginate_text(full_readme, PAGE_SIZE)
+    pages = _get_readme_pages(query.from_user.id, repo) or [""]
     total_pages = len(pages)
 
     # Ensure page is within bounds
@@ -152,14 +134,11 @@ async def _display_readme_page(query, context: ContextTypes.DEFAULT_TYPE, repo:
     # Update current page in context
     context.user_data['readme_page'] = page
 
-    # Get current page content
-    if pages:
-        page_content = pages[page]
-    else:
-        page_content = "No content available"
+    # Get current page content (already escaped)
+    page_content = pages[page]
 
     # Build the message
-    repo_escaped = escape_markdown(repo, 2)
+    repo_escaped = escape_markdown_cached(repo)
     header = f"📖 *README for* __{repo_escaped}__\n"
 
     # Add page indicator if multiple pages
@@ -168,11 +147,8 @@ async def _display_readme_page(query, context: ContextTypes.DEFAULT_TYPE, repo:
     else:
         header += "\n"
 
-    # Escape content
-    content_escaped = escape_markdown(page_content, 2)
-
     # Build final text
-    final_text = header + content_escaped
+    final_text = header + page_content
 
     # Create keyboard
     keyboard = _create_readme_keyboard(page, total_pages)
@@ -186,11 +162,26 @@ async def _display_readme_page(query, context: ContextTypes.DEFAULT_TYPE, repo:
             disable_web_page_preview=True
         )
     except Exception as e:
-        # If message is too long even after pagination, truncate further
-        if "Message is too long" in str(e):
-            content_truncated = page_content[:PAGE_SIZE - 500] + "\n\n... _(Content truncated)_"
-            content_escaped = escape_markdown(content_truncated, 2)
-            final_text = header + content_escaped
+        if "Message is too long" not in str(e):
+            return
+
+        # Re-split with a smaller page size once; later pages inherit it
+        if context.user_data.get('readme_page_size', PAGE_SIZE) > SAFE_PAGE_SIZE:
+            context.user_data['readme_page_size'] = SAFE_PAGE_SIZE
+
+            smaller_pages = []
+            for index, content in enumerate(pages):
+                if index == page:
+                    page = len(smaller_pages)
+                smaller_pages.extend(_paginate_text(content, SAFE_PAGE_SIZE))
+            _store_readme_pages(query.from_user.id, repo, smaller_pages)
+            context.user_data['readme_total_pages'] = len(smaller_pages)
+
+            await _display_readme_page(query, context, repo, page)
+        else:
+            # Still too long at the safe size, truncate further
+            cut = _avoid_split_escape(page_content, SAFE_PAGE_SIZE - 500)
+            final_text = header + page_content[:cut] + escape_markdown_v2("\n\n... _(Content truncated)_")
 
             await query.edit_message_text(
                 final_text,
@@ -200,55 +191,82 @@ async def _display_readme_page(query, context: ContextTypes.DEFAULT_TYPE, repo:
             )
 
 
+def _store_readme_pages(user_id: int, repo: str, pages: list):
+    """Remember a user's README pages, evicting the least recently used entries"""
+    key = (user_id, repo)
+    _readme_pages_cache[key] = (pages, time.monotonic())
+    _readme_pages_cache.move_to_end(key)
+
+    while len(_readme_pages_cache) > README_CACHE_SIZE:
+        _readme_pages_cache.popitem(last=False)
+
+
+def _get_readme_pages(user_id: int, repo: str):
+    """Get a user's README pages if they are still cached"""
+    key = (user_id, repo)
+    entry = _readme_pages_cache.get(key)
+    if not entry:
+        return None
+
+    pages, stored_at = entry
+    if time.monotonic() - stored_at > README_CACHE_TTL:
+        del _readme_pages_cache[key]
+        return None
+
+    _readme_pages_cache.move_to_end(key)
+    return pages
+
+
 def _paginate_text(text: str, page_size: int) -> list:
     """Split text into pages intelligently"""
     if not text:
         return [""]
 
     pages = []
-    remaining = text
+    start = 0
+    end = len(text)
+
+    # Break points are only accepted past 70% of the page, so scan just that tail
+    min_break = int(page_size * 0.7) + 1
 
-    while remaining:
-        if len(remaining) <= page_size:
-            pages.append(remaining)
+    # Work on offsets into text so large READMEs are never re-sliced per page
+    while start < end:
+        if end - start <= page_size:
+            pages.append(text[start:])
             break
 
-        # Find a good break point
-        truncate_at = page_size
+        # Find the last break point of each kind in one pass
+        last = {}
+        for match in _BREAK_RE.finditer(text, start + min_break, start + page_size):
+            last[match.lastgroup] = match.end()
+
+        # Prefer paragraph, then line, then sentence, then word breaks
+        split_at = (
+            last.get("paragraph")
+            or last.get("line")
+            or last.get("sentence")
+            or last.get("word")
+            or _avoid_split_escape(text, start + page_size, start)
+        )
 
-        # Try to break at paragraph
-        last_paragraph = remaining.rfind('\n\n', 0, truncate_at)
-        if last_paragraph > page_size * 0.7:
-            split_at = last_paragraph + 2  # Include the newlines
-        else:
-            # Try to break at line
-            last_line = remaining.rfind('\n', 0, truncate_at)
-            if last_line > page_size * 0.7:
-                split_at = last_line + 1
-            else:
-                # Try to break at sentence
-                last_sentence = max(
-                    remaining.rfind('. ', 0, truncate_at),
-                    remaining.rfind('! ', 0, truncate_at),
-                    remaining.rfind('? ', 0, truncate_at)
-                )
-                if last_sentence > page_size * 0.7:
-                    split_at = last_sentence + 2
-                else:
-                    # Break at word
-                    last_space = remaining.rfind(' ', 0, truncate_at)
-                    if last_space > page_size * 0.7:
-                        split_at = last_space + 1
-                    else:
-                        split_at = truncate_at
-
-        # Add page and continue
-        pages.append(remaining[:split_at].rstrip())
-        remaining = remaining[split_at:].lstrip()
+        # Add page and continue after any leading whitespace
+        pages.append(text[start:split_at].rstrip())
+        start = _LEADING_SPACE_RE.match(text, split_at).end()
 
     return pages if pages else [""]
 
 
+def _avoid_split_escape(text: str, split_at: int, start: int = 0) -> int:
+    """Move a split point back so a MarkdownV2 escape stays with its character"""
+    run_start = split_at
+    while run_start > start and text[run_start - 1] == "\\":
+        run_start -= 1
+
+    if (split_at - run_start) % 2 and split_at - 1 > start:
+        return split_at - 1
+    return split_at
+
+
 def _create_readme_keyboard(current_page: int, total_pages: int):
     """Create keyboard with navigation buttons"""
     buttons = []
@@ -293,11 +311,7 @@ def _create_readme_keyboard(current_page: int, total_pages: int):
             buttons.append(jump_row)
 
     # Action buttons
-    action_row = [
-        InlineKeyboardButton("🔄 Refresh", callback_data="readme"),
-        InlineKeyboardButton("⬅️ Back to Repository", callback_data="refresh")
-    ]
-    buttons.append(action_row)
+    buttons.append(_README_ACTION_ROW)
 
     return InlineKeyboardMarkup(buttons)
 
@@ -308,9 +322,8 @@ async def handle_readme_pages(update: Update, context: ContextTypes.DEFAULT_TYPE
     query = update.callback_query
     await query.answer()
 
-    full_readme = context.user_data.get("full_readme", "")
-    pages = _paginate_text(full_readme, PAGE_SIZE)
-    total_pages = len(pages)
+    repo = context.user_data.get("current_repo", "")
+    total_pages = context.user_data.get("readme_total_pages", 1)
     current_page = context.user_data.get("readme_page", 0)
 
     # Create page selection keyboard
@@ -337,8 +350,7 @@ async def handle_readme_pages(update: Update, context: ContextTypes.DEFAULT_TYPE
 
     keyboard = InlineKeyboardMarkup(buttons)
 
-    repo = context.user_data.get("current_repo", "")
-    repo_escaped = escape_markdown(repo, 2)
+    repo_escaped = escape_markdown_cached(repo)
 
     text = f"📖 *{repo_escaped} README*\n\n"
     text += f"📄 *Select Page*\n\n"
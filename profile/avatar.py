@@ -1,6 +1,8 @@
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 import logging
 
+from profile.state import get_profile_state
+
 logger = logging.getLogger(__name__)
 
 
@@ -10,7 +12,7 @@ class AvatarHandler:
     async def show_user_avatar_info(self, message, username, context, preserve_content=True):
             """Show avatar info inline (not as separate message)"""
             try:
-                user_data = context.user_data.get("current_user")
+                user_data = get_profile_state(context).user
 
                 if not user_data:
                     return False, "Session expired"
@@ -29,7 +31,7 @@ class AvatarHandler:
     async def show_user_avatar(self, message, username, context):
             """Legacy method - creates separate message (if still needed elsewhere)"""
             try:
-                user_data = context.user_data.get("current_user")
+                user_data = get_profile_state(context).user
 
                 if not user_data:
                     await self._show_session_error(message)
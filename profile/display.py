@@ -2,149 +2,303 @@ from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 from datetime import datetime
 import logging
 import asyncio
-import aiohttp
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
 
 # Import the loading system
-from utils.loading import show_loading, show_error, show_static_loading
+from utils.loading import fetch_with_loading, show_static_loading
 from utils.formatting import _escape_markdown_v2 # Import the new escape function
+from utils.git_api import _make_request_with_retry, get_github_session, NotFoundError, RAW_MEDIA_TYPE
+from profile.state import get_profile_state
 
 logger = logging.getLogger(__name__)
 
+# Social links in profile READMEs: a t.me username, and the first PDF link
+# on a line that mentions a resume/CV. The lookbehind keeps t.me from
+# matching inside longer hosts such as chat.me.
+_TELEGRAM_LINK_RE = re.compile(r"(?<![\w.-])(?:https?://)?t\.me/([A-Za-z0-9_]{4,})", re.IGNORECASE)
+_PDF_LINK_RE = re.compile(r"https?://[^\s)\]>]+\.[pP][dD][fF]")
+_CV_KEYWORD_RE = re.compile(r"resume|cv|curriculum", re.IGNORECASE)
+
+# Optional profile fields in display order: (header indicator, detail line).
+# Details get both the escaped value (for link text) and the raw one (for URLs).
+_PROFILE_FIELD_FORMATS = (
+    (" 🏢", "🏢 {escaped}\n"),  # company
+    (" 📍", "📍 {escaped}\n"),  # location
+    (" 🌐", "🌐 [{escaped}]({raw})\n"),  # blog
+    (" 🐦", "🐦 [@{escaped}](https://twitter.com/{raw})\n"),  # twitter
+)
+
+# Fixed profile text, assembled once
+_ADMIN_PROFILE_HEADER = (
+    "═══════ 💎⚡ 𝔸𝔻𝕄𝕀ℕ ℙℝ𝕆𝔽𝕀𝕃𝔼 ⚡💎 ═══════\n"
+    "💡🙃🚫 Spoiler: Nothing Special Here 🚫🙃💡\n\n"
+)
+_ADMIN_PROFILE_FOOTER = "\n═══ ❌🔥 Nothing Survives This Profile 🔥❌ ═══\n"
+_PROFILE_TIP = "\n\n💡 **Tip:** Use the 📸 button to view the profile picture!"
+_PROFILE_ERROR_TEMPLATE = (
+    "{title}\n\n"
+    "❌ **{error_type}**\n\n"
+    "Unable to display profile information.\n\n"
+    "**Possible causes:**\n"
+    "• Profile data incomplete\n"
+    "• Display formatting error\n"
+    "• Connection timeout\n\n"
+    "💡 **Tip:** Try refreshing the profile!"
+)
+
+# Only the first 16K characters of a profile README are scanned for links
+_README_SCAN_CHARS = 16 * 1024
+
+# Location/company cleanup: prefixes to drop, and leading emoji/non-ASCII runs
+_TEXT_FIELD_PREFIXES = ('@', 'at ', 'in ', 'from ', 'based in ', 'working at ')
+_LEADING_SYMBOLS_RE = re.compile(r"[\s\x80-\U0010ffff]*")
+# Current year, rechecked at most hourly instead of on every render
+_current_year_value = None
+_current_year_checked_at = 0.0
+
+
+def _current_year():
+    """Get the current year, refreshing the cached value once an hour"""
+    global _current_year_value, _current_year_checked_at
+    now = time.monotonic()
+    if _current_year_value is None or now - _current_year_checked_at > 3600:
+        _current_year_value = datetime.now().year
+        _current_year_checked_at = now
+    return _current_year_value
+
+
+@lru_cache(maxsize=256)
+def _profile_title(username):
+    """Profile header shared by loading, error and refresh messages, escaped once per user"""
+    return f"👤 **{_escape_markdown_v2(username)}'s Profile**" # Use the new escape function
+
+
+# Profile action buttons as (label, callback_data) templates, one tuple per row
+_PROFILE_KEYBOARD_LAYOUT = (
+    (("📸 View Avatar", "show_avatar_{user}"), ("📂 Repositories", "user_repos_{user}")),
+    (("⭐ Starred", "user_starred_{user}"), ("👥 Followers ({followers})", "user_followers_{user}")),
+    (("👤 Following ({following})", "user_following_{user}"), ("📊 Stats & Activity", "user_stats_{user}")),
+    (("🔄 Refresh", "refresh_user_{user}"), ("⬅️ Back", "back_to_start")),
+)
+
+
+@lru_cache(maxsize=256)
+def _build_profile_keyboard(username, followers_s, following_s):
+    """Build the profile action keyboard (markups are immutable, so they are cached)"""
+    values = {
+        "user": _escape_markdown_v2(username),
+        "followers": _escape_markdown_v2(followers_s),  # Counts arrive pre-formatted
+        "following": _escape_markdown_v2(following_s),
+    }
+    return InlineKeyboardMarkup([
+        [
+            InlineKeyboardButton(label.format_map(values), callback_data=callback.format_map(values))
+            for label, callback in row
+        ]
+        for row in _PROFILE_KEYBOARD_LAYOUT
+    ])
+
 
 class ProfileDisplay:
+    # Short-lived caches shared by all instances, keyed by lowercase username
+    USER_CACHE_TTL = 60  # 1 minute
+    README_CACHE_TTL = 600  # 10 minutes
+    CACHE_SIZE = 256
+    NO_README_TTL = 3600  # 1 hour, most users never add a profile README
+    NO_README_CACHE_SIZE = 5000
+    _user_cache = OrderedDict()
+    _readme_cache = OrderedDict()
+    _no_readme = OrderedDict()
+    _inflight_users = {}  # lowercase username -> running fetch task
+    _inflight_readmes = {}  # lowercase username -> running README lookup
+
     def __init__(self):
         self.PROFILE_ANIMATION = "magic"  # Magic animation for profile loading
 
-    async def show_user_profile(self, message, user_data, context, username=None, is_admin_profile: bool = False):
-        """Display beautiful user profile with loading animation and error handling"""
+    @classmethod
+    def _cache_get(cls, cache, key, ttl):
+        """Get a cached value if it has not expired"""
+        entry = cache.get(key)
+        if not entry:
+            return None
 
-        # Extract username for loading display
-        display_username = username or user_data.get("login", "Unknown User")
+        value, stored_at = entry
+        if time.monotonic() - stored_at > ttl:
+            del cache[key]
+            return None
 
-        # Show static loading first to preserve the window
-        await show_static_loading(
-            message,
-            f"👤 **{_escape_markdown_v2(display_username)}'s Profile**", # Use the new escape function
-            "Loading profile",
-            preserve_content=True,
-            animation_type=self.PROFILE_ANIMATION,
-        )
+        cache.move_to_end(key)
+        return value
 
-        # Start animated loading
-        loading_task = await show_loading(
-            message,
-            f"👤 **{_escape_markdown_v2(display_username)}'s Profile**", # Use the new escape function
-            "Loading profile",
-            animation_type=self.PROFILE_ANIMATION,
-        )
+    @classmethod
+    def _cache_set(cls, cache, key, value, max_size=None):
+        """Cache a value, evicting the least recently used entries"""
+        cache[key] = (value, time.monotonic())
+        cache.move_to_end(key)
 
-        try:
-            # Process the user data (no separate image)
-            profile_content = await self._build_profile_content(user_data, context, is_admin_profile=is_admin_profile)
+        while len(cache) > (max_size or cls.CACHE_SIZE):
+            cache.popitem(last=False)
 
-            # Stop loading animation gracefully
-            if loading_task and not loading_task.done():
-                loading_task.cancel()
-                try:
-                    await loading_task
-                except asyncio.CancelledError:
-                    pass
+    async def show_user_profile(self, message, user_data, context, username=None, is_admin_profile: bool = False, refresh: bool = False):
+        """Display beautiful user profile with loading animation and error handling"""
 
-            if not profile_content:
-                logger.error(f"_build_profile_content returned None for {display_username}")
-                await self._show_profile_error(message, display_username, "Invalid Data")
-                return
+        # Extract username for loading display
+        display_username = username or user_data.get("login", "Unknown User")
 
-            profile_text, keyboard = profile_content
+        readme_task = self._start_readme_lookup(user_data, refresh)
 
-            # Update with final content
-            try:
-                await message.edit_text(
-                    profile_text,
-                    parse_mode="Markdown",
-                    reply_markup=InlineKeyboardMarkup(keyboard),
-                    disable_web_page_preview=True,
-                )
-            except Exception as edit_error:
-                logger.warning(f"Profile edit failed: {type(edit_error).__name__}")
+        try:
+            # Process the user data (no separate image); cached profiles build
+            # fast enough that no loading animation is shown
+            profile_content = await fetch_with_loading(
+                self._build_profile_content(
+                    user_data, context, is_admin_profile=is_admin_profile, refresh=refresh, readme_task=readme_task
+                ),
+                message,
+                _profile_title(display_username),
+                "Loading profile",
+                animation_type=self.PROFILE_ANIMATION,
+            )
 
-        except Exception as e:
-            # Stop loading animation gracefully
-            if loading_task and not loading_task.done():
-                loading_task.cancel()
-                try:
-                    await loading_task
-                except asyncio.CancelledError:
-                    pass
+            await self._show_profile_content(message, profile_content, display_username)
 
+        except Exception as e:
             logger.error(f"Profile display error for {_escape_markdown_v2(display_username)}: {type(e).__name__}", exc_info=True) # Log full exception info
             await self._show_profile_error(message, display_username, "Display Error")
 
+        finally:
+            # Don't leave the README lookup running if the profile was never built
+            if readme_task and not readme_task.done():
+                readme_task.cancel()
+
     async def refresh_user_profile(self, message, username, context):
         """Refresh user profile with loading animation"""
 
-        # Show static loading first to preserve the window
-        await show_static_loading(
-            message,
-            f"👤 **{_escape_markdown_v2(username)}'s Profile**", # Use the new escape function
-            "Refreshing profile",
-            preserve_content=True,
-            animation_type=self.PROFILE_ANIMATION,
-        )
+        try:
+            # One loading animation covers both fetching and rebuilding the
+            # profile, and is skipped when GitHub answers quickly
+            user_data, profile_content = await fetch_with_loading(
+                self._load_fresh_profile(username, context),
+                message,
+                _profile_title(username),
+                "Refreshing profile",
+                animation_type=self.PROFILE_ANIMATION,
+            )
 
-        # Start animated loading
-        loading_task = await show_loading(
-            message,
-            f"👤 **{_escape_markdown_v2(username)}'s Profile**", # Use the new escape function
-            "Refreshing profile",
-            animation_type=self.PROFILE_ANIMATION,
-        )
+            if not user_data:
+                await self._show_profile_error(message, username, "Refresh Failed")
+                return
+
+            # Update context with fresh data
+            get_profile_state(context).user = user_data
 
+            # Show the updated profile
+            await self._show_profile_content(message, profile_content, username)
+
+        except Exception as e:
+            # Log minimal error info
+            logger.error(f"Profile refresh error for {_escape_markdown_v2(username)}: {type(e).__name__}", exc_info=True) # Log full exception info
+            await self._show_profile_error(message, username, "Refresh Error")
+
+    async def _load_fresh_profile(self, username, context):
+        """Refetch a user record and its README, bypassing the caches, and build its profile content"""
+        # The README lives in the username/username repo, so fetch it
+        # alongside fresh user data instead of after it
+        readme_task = asyncio.create_task(self._get_readme_info(username, refresh=True))
         try:
-            # Fetch fresh user data
-            from utils.git_api import _make_request_with_retry
+            user_data = await self.get_user(username, refresh=True)
+            if not user_data:
+                return None, None
 
-            timeout = aiohttp.ClientTimeout(total=10, connect=5)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                user_data = await _make_request_with_retry(
-                    session, f"/users/{username}", timeout=8
-                )
+            readme_task = self._start_readme_lookup(user_data, True, readme_task)
+            return user_data, await self._build_profile_content(
+                user_data, context, refresh=True, readme_task=readme_task
+            )
+        finally:
+            if readme_task and not readme_task.done():
+                readme_task.cancel()
+
+    async def get_user(self, username, refresh=False):
+        """Get a user record, served from the short-lived cache unless refreshing"""
+        key = username.lower()
+        if not refresh:
+            user_data = self._cache_get(self._user_cache, key, self.USER_CACHE_TTL)
+            if user_data is not None:
+                return user_data
+
+        user_data = await self._fetch_user(username)
+        if user_data:
+            self._cache_set(self._user_cache, key, user_data)
+        return user_data
+
+    @staticmethod
+    async def _shared_request(inflight, key, make_request):
+        """Await a request, sharing one running task between concurrent callers"""
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(make_request())
+            inflight[key] = task
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+
+        # Shield so one caller giving up doesn't cancel the request for the others
+        return await asyncio.shield(task)
+
+    async def _fetch_user(self, username):
+        """Fetch a user record, sharing one request between concurrent callers"""
+        return await self._shared_request(
+            self._inflight_users, username.lower(), lambda: self._request_user(username)
+        )
 
-                # Stop loading animation gracefully
-                if loading_task and not loading_task.done():
-                    loading_task.cancel()
-                    try:
-                        await loading_task
-                    except asyncio.CancelledError:
-                        pass
+    async def _request_user(self, username):
+        """Fetch a fresh user record from GitHub"""
+        return await _make_request_with_retry(
+            get_github_session(), f"/users/{username}", timeout=8, use_cache=False
+        )
 
-                if not user_data:
-                    await self._show_profile_error(message, username, "Refresh Failed")
-                    return
+    def _start_readme_lookup(self, user_data, refresh=False, readme_task=None):
+        """Cache the user record and start fetching its README info in the background"""
+        if not isinstance(user_data, dict) or not user_data.get("login"):
+            if readme_task:
+                readme_task.cancel()
+            return None
 
-                # Update context with fresh data
-                context.user_data["current_user"] = user_data
+        # Remember the user record so opening the profile again soon does not refetch it
+        self._cache_set(self._user_cache, user_data["login"].lower(), user_data)
 
-                # Show the updated profile
-                await self.show_user_profile(message, user_data, context, username)
+        # Start the README lookup now so it overlaps the loading edits
+        return readme_task or asyncio.create_task(self._get_readme_info(user_data["login"], refresh))
 
-        except Exception as e:
-            # Stop loading animation gracefully
-            if loading_task and not loading_task.done():
-                loading_task.cancel()
-                try:
-                    await loading_task
-                except asyncio.CancelledError:
-                    pass
+    async def _show_profile_content(self, message, profile_content, display_username):
+        """Replace the loading message with the built profile"""
+        if not profile_content:
+            logger.error(f"_build_profile_content returned None for {display_username}")
+            await self._show_profile_error(message, display_username, "Invalid Data")
+            return
 
-            # Log minimal error info
-            logger.error(f"Profile refresh error for {_escape_markdown_v2(username)}: {type(e).__name__}", exc_info=True) # Log full exception info
-            await self._show_profile_error(message, username, "Refresh Error")
+        profile_text, keyboard = profile_content
 
-    async def _build_profile_content(self, user_data, context, is_admin_profile: bool = False):
+        # Update with final content; shielded so a cancelled handler still
+        # delivers the profile it already spent the GitHub requests on
+        try:
+            await asyncio.shield(message.edit_text(
+                profile_text,
+                parse_mode="Markdown",
+                reply_markup=keyboard,
+                disable_web_page_preview=True,
+            ))
+        except asyncio.CancelledError:
+            logger.info(f"Profile edit for {display_username} left to finish after cancellation")
+            raise
+        except Exception as edit_error:
+            logger.warning(f"Profile edit failed: {type(edit_error).__name__}")
+
+    async def _build_profile_content(self, user_data, context, is_admin_profile: bool = False, refresh: bool = False, readme_task=None):
         """Build enhanced profile content from user data"""
-        logger.debug(f"_build_profile_content: Received user_data type: {type(user_data)}")
-        logger.debug(f"_build_profile_content: Received user_data: {user_data}")
+        logger.debug("_build_profile_content: Received user_data type: %s", type(user_data))
+        logger.debug("_build_profile_content: Received user_data: %s", user_data)
         try:
             if not user_data or not isinstance(user_data, dict):
                 logger.error(f"_build_profile_content: Invalid user_data received: {user_data}")
@@ -165,221 +319,191 @@ class ProfileDisplay:
             following = user_data.get("following", 0)
             public_gists = user_data.get("public_gists", 0)
             
-            logger.debug(f"_build_profile_content: Extracted name: {name}, username: {username}")
-            logger.debug(f"_build_profile_content: Extracted public_repos: {public_repos}, followers: {followers}, following: {following}")
+            logger.debug("_build_profile_content: Extracted name: %s, username: %s", name, username)
+            logger.debug("_build_profile_content: Extracted public_repos: %s, followers: %s, following: %s", public_repos, followers, following)
+
+            # Format each count once; the stats block and keyboard share them
+            repos_s = f"{public_repos:,}"
+            followers_s = f"{followers:,}"
+            following_s = f"{following:,}"
+            gists_s = f"{public_gists:,}"
 
             # Clean location and company
             location = self._clean_text_field(location)
             company = self._clean_text_field(company)
-            logger.debug(f"_build_profile_content: Cleaned location: {location}, company: {company}")
+            logger.debug("_build_profile_content: Cleaned location: %s, company: %s", location, company)
 
             # Get additional info from README
-            readme_info = await self._get_readme_info(username)
-            logger.debug(f"_build_profile_content: Readme info: {readme_info}")
+            if readme_task:
+                readme_info = await readme_task
+            else:
+                readme_info = await self._get_readme_info(username, refresh)
+            logger.debug("_build_profile_content: Readme info: %s", readme_info)
 
             # Format join date
             created_at = user_data.get("created_at", "")
             years_on_github = 0
-            logger.debug(f"_build_profile_content: Raw created_at: {created_at}")
+            logger.debug("_build_profile_content: Raw created_at: %s", created_at)
             if created_at:
                 try:
-                    created_date = datetime.strptime(created_at, "%Y-%m-%dT%H:%M:%SZ")
+                    created_date = datetime.fromisoformat(created_at)
                     joined = created_date.strftime("%B %d, %Y")
-                    years_on_github = datetime.now().year - created_date.year
-                    logger.debug(f"_build_profile_content: Formatted joined: {joined}, years_on_github: {years_on_github}")
-                except Exception as date_error:
+                    years_on_github = _current_year() - created_date.year
+                    logger.debug("_build_profile_content: Formatted joined: %s, years_on_github: %s", joined, years_on_github)
+                except (ValueError, TypeError) as date_error:
                     logger.error(f"_build_profile_content: Date parsing error for '{created_at}': {date_error}")
                     joined = "Unknown"
                     years_on_github = 0
             else:
                 joined = "Unknown"
 
+            parts = []
+
+            # Add admin specific badge and styling
+            if is_admin_profile:
+                # Add a prominent admin badge and top/bottom separators
+                parts.append(_ADMIN_PROFILE_HEADER)
+
             # Build beautiful profile - REMOVED CLICKABLE USERNAME
-            profile_text = f"👤 **{_escape_markdown_v2(name)}**\n" # Use the new escape function
-            profile_text += f"🏷️ **{_escape_markdown_v2(username)}**" # Use the new escape function
+            parts.append(f"👤 **{_escape_markdown_v2(name)}**\n") # Use the new escape function
+            escaped_username = _escape_markdown_v2(username)
+            parts.append(f"🏷️ **{escaped_username}**")
+
+            if blog and not blog.startswith(("http://", "https://")):
+                blog = f"https://{blog}"
+            profile_fields = [
+                (field_format, value)
+                for field_format, value in zip(_PROFILE_FIELD_FORMATS, (company, location, blog, twitter))
+                if value
+            ]
 
             # Add profile indicators
-            if company:
-                profile_text += " 🏢"
-            if location:
-                profile_text += " 📍"
-            if blog:
-                profile_text += " 🌐"
-            if twitter:
-                profile_text += " 🐦"
+            indicators = [indicator for (indicator, _), _ in profile_fields]
             if readme_info.get('telegram'):
-                profile_text += " ✈️"
+                indicators.append(" ✈️")
             if avatar_url:  # Show photo indicator if avatar exists
-                profile_text += " 📸"
+                indicators.append(" 📸")
+            parts.append("".join(indicators))
 
-            profile_text += "\n\n"  # FIXED: This was inside the if statement
+            parts.append("\n\n")  # FIXED: This was inside the if statement
 
             if bio:
-                profile_text += f"📝 _{_escape_markdown_v2(bio[:150])}{'...' if len(bio) > 150 else ''}_\n\n" # Use the new escape function
+                if len(bio) > 150:
+                    bio = bio[:150] + "…"
+                parts.append(f"📝 _{_escape_markdown_v2(bio)}_\n\n") # Use the new escape function
 
             # Stats section
-            profile_text += "📊 **GitHub Stats**\n"
-            profile_text += f"┌─ 📂 **{public_repos:,}** public repositories\n"
-            profile_text += f"├─ 👥 **{followers:,}** followers\n"
-            profile_text += f"├─ 👤 **{following:,}** following\n"
-            profile_text += f"└─ 📄 **{public_gists:,}** public gists\n\n"
+            parts.append(
+                "📊 **GitHub Stats**\n"
+                f"┌─ 📂 **{repos_s}** public repositories\n"
+                f"├─ 👥 **{followers_s}** followers\n"
+                f"├─ 👤 **{following_s}** following\n"
+                f"└─ 📄 **{gists_s}** public gists\n\n"
+            )
 
             # Details section
-            profile_text += "ℹ️ **Profile Details**\n"
-            if company:
-                profile_text += f"🏢 {_escape_markdown_v2(company)}\n" # Use the new escape function
-            if location:
-                profile_text += f"📍 {_escape_markdown_v2(location)}\n" # Use the new escape function
-            if blog:
-                if not blog.startswith(("http://", "https://")):
-                    blog = f"https://{blog}"
-                profile_text += f"🌐 [{_escape_markdown_v2(blog)}]({blog})\n" # Use the new escape function
-            if twitter:
-                profile_text += f"🐦 [@{_escape_markdown_v2(twitter)}](https://twitter.com/{twitter})\n" # Use the new escape function
+            parts.append("ℹ️ **Profile Details**\n")
+            for (_, detail), value in profile_fields:
+                parts.append(detail.format(escaped=_escape_markdown_v2(value), raw=value))
 
             # Add social links if found
             if readme_info.get('telegram'):
-                profile_text += f"✈️ [Telegram]({readme_info['telegram']})\n"
+                parts.append(f"✈️ [Telegram]({readme_info['telegram']})\n")
 
             if readme_info.get('cv'):
-                profile_text += f"📄 [CV/Resume]({readme_info['cv']})\n"
+                parts.append(f"📄 [CV/Resume]({readme_info['cv']})\n")
 
-            profile_text += f"📅 Joined {_escape_markdown_v2(joined)}"
+            parts.append(f"📅 Joined {_escape_markdown_v2(joined)}")
             if years_on_github > 0:
-                profile_text += f" ({years_on_github} years ago)"
-            profile_text += "\n"
+                parts.append(f" ({years_on_github} years ago)")
+            parts.append("\n")
 
-            profile_text += f"\n🔗 [View on GitHub](https://github.com/{_escape_markdown_v2(username)})" # Use the new escape function
-            profile_text += f"\n\n💡 **Tip:** Use the 📸 button to view the profile picture!"
+            parts.append(f"\n🔗 [View on GitHub](https://github.com/{escaped_username})")
+            parts.append(_PROFILE_TIP)
 
-            # Add admin specific badge and styling
             if is_admin_profile:
-                # Add a prominent admin badge and top/bottom separators
-                admin_header = f"═══════ 💎⚡ 𝔸𝔻𝕄𝕀ℕ ℙℝ𝕆𝔽𝕀𝕃𝔼 ⚡💎 ═══════\n"
-                admin_badge = f"💡🙃🚫 Spoiler: Nothing Special Here 🚫🙃💡\n"
-                admin_footer = f"\n═══ ❌🔥 Nothing Survives This Profile 🔥❌ ═══\n"
-                profile_text = f"{admin_header}{admin_badge}\n{profile_text}{admin_footer}"
-            
-            # Create action buttons with avatar button
-            keyboard = [
-                [
-                    InlineKeyboardButton(
-                        "📸 View Avatar", callback_data=f"show_avatar_{_escape_markdown_v2(username)}" # Use the new escape function
-                    ),
-                    InlineKeyboardButton(
-                        "📂 Repositories", callback_data=f"user_repos_{_escape_markdown_v2(username)}" # Use the new escape function
-                    ),
-                ],
-                [
-                    InlineKeyboardButton(
-                        "⭐ Starred", callback_data=f"user_starred_{_escape_markdown_v2(username)}" # Use the new escape function
-                    ),
-                    InlineKeyboardButton(
-                        f"👥 Followers ({_escape_markdown_v2(f'{followers:,}')})", # Apply formatting before escaping
-                        callback_data=f"user_followers_{_escape_markdown_v2(username)}", # Use the new escape function
-                    ),
-                ],
-                [
-                    InlineKeyboardButton(
-                        f"👤 Following ({_escape_markdown_v2(f'{following:,}')})", # Apply formatting before escaping
-                        callback_data=f"user_following_{_escape_markdown_v2(username)}", # Use the new escape function
-                    ),
-                    InlineKeyboardButton(
-                        "📊 Stats & Activity", callback_data=f"user_stats_{_escape_markdown_v2(username)}" # Use the new escape function
-                    )
-                ],
-                [
-                    InlineKeyboardButton(
-                        "🔄 Refresh", callback_data=f"refresh_user_{_escape_markdown_v2(username)}" # Use the new escape function
-                    ),
-                    InlineKeyboardButton("⬅️ Back", callback_data="back_to_start"),
-                ],
-            ]
+                parts.append(_ADMIN_PROFILE_FOOTER)
+
+            profile_text = "".join(parts)
+
+            # Action buttons with avatar button, shared between renders of the same profile
+            keyboard = _build_profile_keyboard(username, followers_s, following_s)
 
             return profile_text, keyboard
 
-        except Exception as e:
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
             logger.warning(f"Profile content build error: {type(e).__name__} - {e}", exc_info=True) # Log full exception info
             return None
 
-    async def _get_readme_info(self, username):
+    async def _get_readme_info(self, username, refresh=False):
         """Get additional info from user's README"""
+        cache_key = username.lower()
+        if not refresh:
+            cached_info = self._cache_get(self._readme_cache, cache_key, self.README_CACHE_TTL)
+            if cached_info is not None:
+                return cached_info
+
+            # Users known to have no profile README skip the request entirely
+            if self._cache_get(self._no_readme, cache_key, self.NO_README_TTL):
+                return {'telegram': None, 'cv': None}
+        else:
+            # A refresh must pick up a README added since it was found missing
+            self._no_readme.pop(cache_key, None)
+
+        # Concurrent profile views of the same user share one README request
+        return await self._shared_request(
+            self._inflight_readmes, cache_key, lambda: self._request_readme_info(username, refresh)
+        )
+
+    async def _request_readme_info(self, username, refresh=False):
+        """Fetch a user's profile README and extract its links into the caches"""
+        cache_key = username.lower()
         info = {'telegram': None, 'cv': None}
 
         try:
-            from utils.git_api import _make_request_with_retry
-
-            timeout = aiohttp.ClientTimeout(total=5, connect=3)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                # Try to get README from profile repo
-                readme = await _make_request_with_retry(
-                    session, f"/repos/{username}/{username}/readme", timeout=4
-                )
-
-                # If README exists and has content, extract info
-                if readme and isinstance(readme, dict) and readme.get('content'):
-                    import base64
-                    try:
-                        content = base64.b64decode(readme['content']).decode('utf-8', errors='ignore')
-                        info = self._extract_social_links(content)
-                    except Exception as decode_error:
-                        # Log but don't raise - just return empty info
-                        logger.debug(f"README decode error for {username}: {type(decode_error).__name__}")
-                else:
-                    # No README found or invalid response - this is normal, not an error
-                    logger.debug(f"No README found for {username}")
+            # Try to get README from profile repo, as plain text
+            readme = await _make_request_with_retry(
+                get_github_session(), f"/repos/{username}/{username}/readme", timeout=4,
+                use_cache=not refresh, accept=RAW_MEDIA_TYPE
+            )
+
+            # If README exists and has content, extract info
+            if readme and isinstance(readme, str):
+                # Social links sit near the top, so only scan the start of large READMEs
+                info = self._extract_social_links(readme[:_README_SCAN_CHARS])
+                self._cache_set(self._readme_cache, cache_key, info)
+                self._no_readme.pop(cache_key, None)
+            else:
+                # No README found or invalid response - this is normal, not an error
+                logger.debug("No README found for %s", username)
+                self._cache_set(self._no_readme, cache_key, True, self.NO_README_CACHE_SIZE)
+
+        except NotFoundError:
+            logger.debug("No README found for %s", username)
+            self._cache_set(self._no_readme, cache_key, True, self.NO_README_CACHE_SIZE)
 
         except Exception as e:
             # Any error in fetching README should not break profile display
-            logger.debug(f"README fetch error for {username}: {type(e).__name__}")
+            logger.debug("README fetch error for %s: %s", username, type(e).__name__)
             # Return default empty info - don't raise
 
         return info
 
     def _extract_social_links(self, content):
-        """Extract social links from README content using simple string operations"""
-        info = {'telegram': None, 'cv': None}
-
-        content_lower = content.lower()
-
-        # Look for Telegram links (simple approach)
-        if 't.me/' in content_lower:
-            try:
-                start_pos = content_lower.find('t.me/')
-                # Find the end of the link
-                end_pos = start_pos + 5  # Start after 't.me/'
-                while end_pos < len(content) and content[end_pos] not in [' ', '\n', ')', ']', '>', '\t']:
-                    end_pos += 1
-
-                telegram_username = content[start_pos + 5:end_pos]
-                if telegram_username and len(telegram_username) > 3:
-                    info['telegram'] = f"https://t.me/{telegram_username}"
-            except Exception:
-                pass
-
-        # Look for CV/Resume links
-        cv_keywords = ['resume', 'cv', 'curriculum']
-        for keyword in cv_keywords:
-            if keyword in content_lower:
-                lines = content.split('\n')
-                for line in lines:
-                    line_lower = line.lower()
-                    if keyword in line_lower and 'http' in line_lower and '.pdf' in line_lower:
-                        # Simple extraction - find first http link in this line
-                        words = line.split()
-                        for word in words:
-                            if word.startswith('http') and '.pdf' in word:
-                                # Clean up the URL
-                                cv_url = word.rstrip('.,;:!)(]>')
-                                if len(cv_url) > 10:
-                                    info['cv'] = cv_url
-                                    break
-                        if info['cv']:
-                            break
-                if info['cv']:
-                    break
+        """Extract social links from README content with precompiled patterns"""
+        telegram_match = _TELEGRAM_LINK_RE.search(content)
+        telegram_url = f"https://t.me/{telegram_match.group(1)}" if telegram_match else None
+
+        # PDF links are rare, so find those first and only then check their line
+        cv_url = None
+        for pdf_match in _PDF_LINK_RE.finditer(content):
+            line_start = content.rfind('\n', 0, pdf_match.start()) + 1
+            line_end = content.find('\n', pdf_match.end())
+            if _CV_KEYWORD_RE.search(content, line_start, line_end if line_end != -1 else len(content)):
+                cv_url = pdf_match.group(0)
+                break
 
-        return info
+        return {'telegram': telegram_url, 'cv': cv_url}
 
     def _clean_text_field(self, value):
         """Clean text fields like location and company"""
@@ -388,16 +512,14 @@ class ProfileDisplay:
 
         # Remove common prefixes
         value = value.strip()
-        prefixes = ['@', 'at ', 'in ', 'from ', 'based in ', 'working at ']
-
-        for prefix in prefixes:
-            if value.lower().startswith(prefix.lower()):
+        lowered = value.lower()
+        for prefix in _TEXT_FIELD_PREFIXES:
+            if lowered.startswith(prefix):
                 value = value[len(prefix):].strip()
                 break
 
         # Remove emojis and special characters from the beginning
-        while value and ord(value[0]) > 127:
-            value = value[1:].strip()
+        value = value[_LEADING_SYMBOLS_RE.match(value).end():]
 
         # Clean up whitespace and limit length
         value = ' '.join(value.split())
@@ -405,14 +527,7 @@ class ProfileDisplay:
 
     async def _show_profile_error(self, message, username, error_type):
         """Show profile error with structured message and action buttons"""
-        error_text = f"👤 **{_escape_markdown_v2(username)}'s Profile**\n\n" # Use the new escape function
-        error_text += f"❌ **{error_type}**\n\n"
-        error_text += f"Unable to display profile information.\n\n"
-        error_text += f"**Possible causes:**\n"
-        error_text += f"• Profile data incomplete\n"
-        error_text += f"• Display formatting error\n"
-        error_text += f"• Connection timeout\n\n"
-        error_text += f"💡 **Tip:** Try refreshing the profile!"
+        error_text = _PROFILE_ERROR_TEMPLATE.format(title=_profile_title(username), error_type=error_type)
 
         keyboard = [
             [
@@ -426,12 +541,15 @@ class ProfileDisplay:
         ]
 
         try:
-            await message.edit_text(
+            await asyncio.shield(message.edit_text(
                 error_text,
                 parse_mode="Markdown",
                 reply_markup=InlineKeyboardMarkup(keyboard),
                 disable_web_page_preview=True,
-            )
+            ))
+        except asyncio.CancelledError:
+            logger.info(f"Profile error edit for {username} left to finish after cancellation")
+            raise
         except Exception as e:
             logger.warning(f"Error display failed: {type(e).__name__}")
 
@@ -439,7 +557,7 @@ class ProfileDisplay:
         """Show loading state for profile - useful for external calls"""
         await show_static_loading(
             message,
-            f"👤 **{_escape_markdown_v2(username)}'s Profile**", # Use the new escape function
+            _profile_title(username),
             "Loading profile",
             preserve_content=True,
             animation_type=self.PROFILE_ANIMATION,
@@ -1,24 +1,144 @@
 # profile/handler.py
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
-import aiohttp
 import logging
 import asyncio
+from collections import OrderedDict
+from functools import lru_cache
 
 from profile.display import ProfileDisplay
 from profile.repositories import ProfileRepositories
 from profile.social import ProfileSocial
 from profile.stats import ProfileStats
 from profile.avatar import AvatarHandler
+from profile.state import get_profile_state
 from utils.formatting import _escape_markdown_v2 # Import for direct use
+from utils.git_api import GITHUB_TOKEN, NotFoundError
 
 # Import the loading system
-from utils.loading import show_loading, show_static_loading
+from utils.loading import fetch_with_loading
 
 logger = logging.getLogger(__name__)
 
 
+# Error messages, filled in per call
+_USER_NOT_FOUND_TEMPLATE = (
+    "👤 **User Search**\n\n"
+    "❌ **User Not Found**\n\n"
+    "User `{username}` not found on GitHub.\n\n"
+    "**Possible reasons:**\n"
+    "• Username doesn't exist\n"
+    "• Account was deleted\n"
+    "• Typo in username\n\n"
+    "💡 **Tip:** Double-check the username spelling!"
+)
+_SEARCH_ERROR_TEMPLATE = (
+    "👤 **{username}'s Profile**\n\n"
+    "❌ **Search Error**\n\n"
+    "Unable to search for user profile.\n\n"
+    "**Possible causes:**\n"
+    "• Network connection issues\n"
+    "• GitHub API temporary unavailable\n"
+    "• Rate limiting\n\n"
+    "💡 **Tip:** Wait a moment and try again!"
+)
+_CALLBACK_ERROR_TEMPLATE = (
+    "👤 **{username}'s Profile**\n\n"
+    "❌ **{error_type}**\n\n"
+    "Something went wrong with this action.\n\n"
+    "💡 **Tip:** Try the action again or go back to profile!"
+)
+_SESSION_LOST_TEXT = (
+    "👤 **User Profile**\n\n"
+    "❌ **Session Expired**\n\n"
+    "Your session has expired or profile data was lost.\n\n"
+    "💡 **Tip:** Search for the user again!"
+)
+
+AVATAR_SIZE = 400
+RENDER_CACHE_SIZE = 1024  # Messages whose last error/status edit is remembered
+
+_BACK_TO_START_BUTTON = InlineKeyboardButton("⬅️ Back to Start", callback_data="back_to_start")
+_BACK_TO_START_MARKUP = InlineKeyboardMarkup([[_BACK_TO_START_BUTTON]])
+
+
+@lru_cache(maxsize=512)
+def _avatar_markup(username):
+    """Keyboard under an avatar photo (markups are immutable, so they are cached)"""
+    return InlineKeyboardMarkup([
+        [
+            InlineKeyboardButton("🏠 Back to Profile", callback_data="back_to_profile"),
+            InlineKeyboardButton("🔄 Refresh Avatar", callback_data=f"refresh_avatar_{username}")
+        ],
+        [
+            InlineKeyboardButton("📂 Repositories", callback_data=f"user_repos_{username}"),
+            InlineKeyboardButton("⭐ Starred", callback_data=f"user_starred_{username}")
+        ],
+        [
+            InlineKeyboardButton("👥 Followers", callback_data=f"user_followers_{username}"),
+            InlineKeyboardButton("👤 Following", callback_data=f"user_following_{username}")
+        ],
+        [_BACK_TO_START_BUTTON],
+    ])
+
+
+# Callback toast labels for actions that are not paginated list views
+_CALLBACK_LABELS = {
+    "user_stats": "Loading stats",
+    "show_avatar": "Loading avatar",
+    "refresh_user": "Refreshing profile",
+    "refresh_avatar": "Refreshing avatar",
+}
+
+
+# Callback kinds whose data ends in a username
+_USER_ACTION_KINDS = frozenset({
+    "user_repos", "user_starred", "user_followers", "user_following", "user_stats", "show_avatar",
+})
+_NAVIGATION_ACTIONS = frozenset({"back_to_profile", "back_to_start"})
+
+
+def _avatar_cdn(url, size=AVATAR_SIZE):
+    """GitHub avatar URL resized to size pixels"""
+    sep = "&" if "?" in url else "?"
+    return f"{url}{sep}s={size}"
+
+
+@lru_cache(maxsize=512)
+def _search_error_markup(username):
+    """Retry / Back to Start keyboard under a failed search"""
+    return InlineKeyboardMarkup([
+        [
+            InlineKeyboardButton("🔄 Retry", callback_data=f"refresh_user_{username}"),
+            _BACK_TO_START_BUTTON,
+        ]
+    ])
+
+
+@lru_cache(maxsize=512)
+def _callback_error_markup(action):
+    """Try Again / Back to Profile keyboard under a failed callback"""
+    return InlineKeyboardMarkup([
+        [
+            InlineKeyboardButton("🔄 Try Again", callback_data=action),
+            InlineKeyboardButton("🏠 Back to Profile", callback_data="back_to_profile"),
+        ],
+        [_BACK_TO_START_BUTTON],
+    ])
+
+
+def _split_action(action):
+    """Split callback data like 'user_repos_octocat' into ('user_repos', 'octocat')"""
+    # GitHub usernames never contain underscores, so the kind is the first two words
+    kind, _, rest = action.partition("_")
+    sub, _, username = rest.partition("_")
+    return f"{kind}_{sub}", username
+
+
 class ProfileHandler:
+    _prefetch_tasks = set()  # Keep references so background prefetches aren't collected
+    _last_render = OrderedDict()  # (chat_id, message_id) -> (content hash, text Telegram shows)
+
     def __init__(self):
         self.display = ProfileDisplay()
         self.repositories = ProfileRepositories()
@@ -27,93 +147,97 @@ class ProfileHandler:
         self.avatar = AvatarHandler()
         self.SEARCH_ANIMATION = "pulse"
 
+        # Paginated list views: action kind -> (show method, what is loaded)
+        self.list_views = {
+            "user_repos": (self.repositories.show_user_repos, "repositories"),
+            "user_starred": (self.repositories.show_starred_repos, "starred repos"),
+            "user_followers": (self.social.show_followers, "followers"),
+            "user_following": (self.social.show_following, "following"),
+        }
+
     async def show_profile(self, update: Update, context: ContextTypes.DEFAULT_TYPE, username: str, loading_msg=None, is_admin_profile: bool = False):
         """Main entry point for showing user profile with loading animation"""
         # If a loading message isn't provided, create one.
         if loading_msg is None:
-            if hasattr(update, "message") and update.message:
+            msg = getattr(update, "message", None)
+            query = getattr(update, "callback_query", None)
+            if msg is not None:
                 escaped_username = _escape_markdown_v2(username) # Use the imported function directly
                 try:
-                    loading_msg = await update.message.edit_text(
+                    loading_msg = await msg.edit_text(
                         f"👤 **{escaped_username}'s Profile**\n\n💡 **Tip:** Searching for user...",
-                        parse_mode="Markdown",
                     )
                 except Exception:
-                    loading_msg = await update.message.reply_text(
+                    loading_msg = await msg.reply_text(
                         f"👤 **{escaped_username}'s Profile**\n\n💡 **Tip:** Searching for user...",
-                        parse_mode="Markdown",
                     )
-            elif hasattr(update, "callback_query") and update.callback_query:
-                query = update.callback_query
+            elif query is not None:
                 await query.answer()
                 loading_msg = query.message
             else:
                 logger.error("Invalid update object passed to show_profile and no loading_msg provided.")
                 return
         
-        # Show static loading first to preserve the window
-        await show_static_loading(
-            loading_msg,
-            f"👤 **{username}'s Profile" + (" (Admin)" if is_admin_profile else ""),
-            "Searching user",
-            preserve_content=True,
-            animation_type=self.SEARCH_ANIMATION,
-        )
-
-        # Start animated loading
-        loading_task = await show_loading(
-            loading_msg,
-            f"👤 **{username}'s Profile" + (" (Admin)" if is_admin_profile else ""),
-            "Searching user",
-            animation_type=self.SEARCH_ANIMATION,
-        )
-
         try:
-            from utils.git_api import fetch_user_info
-
-            timeout = aiohttp.ClientTimeout(total=12, connect=6)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                user_data = await fetch_user_info(session, username)
-
-            # Stop loading animation gracefully
-            if loading_task and not loading_task.done():
-                loading_task.cancel()
-                try:
-                    await loading_task
-                except asyncio.CancelledError:
-                    pass
+            # Animate only if the user is not found quickly (cached records return at once)
+            user_data = await fetch_with_loading(
+                self._find_user(username),
+                loading_msg,
+                f"👤 **{username}'s Profile" + (" (Admin)" if is_admin_profile else ""),
+                "Searching user",
+                animation_type=self.SEARCH_ANIMATION,
+            )
 
             if not user_data:
                 await self._show_user_not_found(loading_msg, username)
                 return
 
             # Store user data for callbacks
-            context.user_data["current_user"] = user_data
-            context.user_data["current_username"] = username
-            context.user_data["current_view"] = "profile"  # Track current view
+            state = get_profile_state(context)
+            state.user = user_data
+            state.username = username
+            state.view = "profile"  # Track current view
+
+            # Warm the first repositories page while the profile is being shown
+            self._prefetch_repositories(user_data)
 
             # Display the profile
             await self.display.show_user_profile(loading_msg, user_data, context, username, is_admin_profile=is_admin_profile)
 
         except Exception as e:
-            # Stop loading animation gracefully
-            if loading_task and not loading_task.done():
-                loading_task.cancel()
-                try:
-                    await loading_task
-                except asyncio.CancelledError:
-                    pass
-
             # Log minimal error info
-            logger.error(f"Profile fetch error for {username}: {type(e).__name__}")
+            logger.error("Profile fetch error for %s: %s", username, type(e).__name__)
             await self._show_search_error(loading_msg, username)
 
+    async def _find_user(self, username):
+        """Look up a user record, or None if there is no such user"""
+        # Reopening a profile within a minute reuses the cached user record
+        lookup_name = username.strip()
+        if not lookup_name:
+            return None
+        try:
+            return await self.display.get_user(lookup_name)
+        except NotFoundError:
+            return None
+
+    def _prefetch_repositories(self, user_data):
+        """Start a background fetch of the first repositories page"""
+        # Unauthenticated requests are limited to 60/hour, too few to spend on speculation
+        if not GITHUB_TOKEN or not user_data.get("public_repos") or not user_data.get("login"):
+            return
+
+        task = asyncio.create_task(self.repositories.prefetch_user_repos(user_data["login"]))
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._prefetch_tasks.discard)
+
     async def handle_profile_callback(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE, action: str
     ):
         """Handle profile-related callback queries with error handling"""
         query = update.callback_query
-        await query.answer()
+        # Acknowledge with a toast instead of an interim "loading" edit
+        label = self._callback_label(action)
+        await query.answer(text=f"⏳ {label}…" if label else None)
 
         try:
             # Parse the action for pagination
@@ -124,235 +248,159 @@ class ProfileHandler:
 
         except Exception as e:
             # Log minimal error info
-            logger.error(f"Callback error for {action}: {type(e).__name__}")
+            logger.error("Callback error for %s: %s", action, type(e).__name__)
             await self._show_callback_error(query.message, action)
 
+    def _callback_label(self, action):
+        """Short progress label for the callback toast, or None for instant actions"""
+        kind, _ = _split_action(action)
+        view = self.list_views.get(kind)
+        if view:
+            return f"Loading {view[1]}"
+        return _CALLBACK_LABELS.get(kind)
+
     async def _handle_paginated_action(self, query, context, action):
         """Handle paginated callback actions with loading"""
         try:
-            parts = action.split("_page_")
-            base_action = parts[0]
-            page = int(parts[1])
+            base_action, _, page_str = action.rpartition("_page_")
+            page = int(page_str)
 
             # Check if we're on avatar page first
-            current_view = context.user_data.get("current_view", "profile")
+            current_view = get_profile_state(context).view
             if current_view == "avatar":
                 await self._restore_profile_from_avatar(query, context)
-                await asyncio.sleep(0.3)
                 return
 
-            if base_action.startswith("user_repos_"):
-                username = base_action.replace("user_repos_", "")
-                original_text, original_markup = await self._show_loading_preserve_content(
-                    query.message, f"Loading repositories page {page}", "tech"
-                )
-                try:
-                    await self.repositories.show_user_repos(
-                        query.message, username, context, page
-                    )
-                except Exception as e:
-                    await self._show_error_preserve_content(
-                        query.message, original_text, original_markup, f"Could not load repositories page {page}"
-                    )
-
-            elif base_action.startswith("user_starred_"):
-                username = base_action.replace("user_starred_", "")
-                original_text, original_markup = await self._show_loading_preserve_content(
-                    query.message, f"Loading starred repos page {page}", "stars"
-                )
-                try:
-                    await self.repositories.show_starred_repos(
-                        query.message, username, context, page
-                    )
-                except Exception as e:
-                    await self._show_error_preserve_content(
-                        query.message, original_text, original_markup, f"Could not load starred repos page {page}"
-                    )
-
-            elif base_action.startswith("user_followers_"):
-                username = base_action.replace("user_followers_", "")
-                original_text, original_markup = await self._show_loading_preserve_content(
-                    query.message, f"Loading followers page {page}", "heart"
-                )
-                try:
-                    await self.social.show_followers(query.message, username, context, page)
-                except Exception as e:
-                    await self._show_error_preserve_content(
-                        query.message, original_text, original_markup, f"Could not load followers page {page}"
-                    )
-
-            elif base_action.startswith("user_following_"):
-                username = base_action.replace("user_following_", "")
-                original_text, original_markup = await self._show_loading_preserve_content(
-                    query.message, f"Loading following page {page}", "wave"
+            kind, username = _split_action(base_action)
+            view = self.list_views.get(kind)
+            if view:
+                show, noun = view
+                await self._run_preserving_content(
+                    query.message, f"Could not load {noun} page {page}",
+                    lambda: show(query.message, username, context, page),
                 )
-                try:
-                    await self.social.show_following(query.message, username, context, page)
-                except Exception as e:
-                    await self._show_error_preserve_content(
-                        query.message, original_text, original_markup, f"Could not load following page {page}"
-                    )
             else:
                 await self._show_callback_error(query.message, action, "Unknown Action")
 
-        except (ValueError, IndexError):
+        except ValueError:
             await self._show_callback_error(query.message, action, "Invalid Page")
 
     async def _handle_regular_action(self, query, context, action):
         """Handle regular callback actions with preserved content loading"""
 
+        kind, username = _split_action(action)
+
         # Check current view
-        current_view = context.user_data.get("current_view", "profile")
+        current_view = get_profile_state(context).view
 
         # Handle avatar-specific actions
-        if current_view == "avatar" and action.startswith("refresh_avatar_"):
-            username = action.replace("refresh_avatar_", "")
+        if current_view == "avatar" and kind == "refresh_avatar":
             await self._handle_refresh_avatar(query, context, username)
             return
 
-        # If we're on avatar page but clicked other buttons, go back to profile first
-        if current_view == "avatar" and not action.startswith(("refresh_avatar_", "back_to_profile", "back_to_start")):
-            await self._restore_profile_from_avatar(query, context)
-            await asyncio.sleep(0.3)
-            # Re-call this method with profile view
-            context.user_data["current_view"] = "profile"
-            await self._handle_regular_action(query, context, action)
-            return
+        message = query.message
 
-        if action.startswith("user_repos_"):
-            username = action.replace("user_repos_", "")
-            original_text, original_markup = await self._show_loading_preserve_content(
-                query.message, "Loading repositories", "tech"
-            )
-            try:
-                await self.repositories.show_user_repos(query.message, username, context, 1)
-            except Exception as e:
-                await self._show_error_preserve_content(
-                    query.message, original_text, original_markup, "Could not load repositories"
-                )
-
-        elif action.startswith("user_starred_"):
-            username = action.replace("user_starred_", "")
-            original_text, original_markup = await self._show_loading_preserve_content(
-                query.message, "Loading starred repos", "stars"
-            )
-            try:
-                await self.repositories.show_starred_repos(query.message, username, context, 1)
-            except Exception as e:
-                await self._show_error_preserve_content(
-                    query.message, original_text, original_markup, "Could not load starred repos"
-                )
-
-        elif action.startswith("user_followers_"):
-            username = action.replace("user_followers_", "")
-            original_text, original_markup = await self._show_loading_preserve_content(
-                query.message, "Loading followers", "heart"
-            )
-            try:
-                await self.social.show_followers(query.message, username, context, 1)
-            except Exception as e:
-                await self._show_error_preserve_content(
-                    query.message, original_text, original_markup, "Could not load followers"
-                )
+        # If we're on avatar page but clicked other buttons, go back to profile first
+        # and carry on with the action on the restored profile message
+        if current_view == "avatar" and kind != "refresh_avatar" and action not in _NAVIGATION_ACTIONS:
+            message = await self._restore_profile_from_avatar(query, context)
+            if message is None:
+                return
 
-        elif action.startswith("user_following_"):
-            username = action.replace("user_following_", "")
-            original_text, original_markup = await self._show_loading_preserve_content(
-                query.message, "Loading following", "wave"
+        view = self.list_views.get(kind)
+        if view:
+            show, noun = view
+            await self._run_preserving_content(
+                message, f"Could not load {noun}",
+                lambda: show(message, username, context, 1),
             )
-            try:
-                await self.social.show_following(query.message, username, context, 1)
-            except Exception as e:
-                await self._show_error_preserve_content(
-                    query.message, original_text, original_markup, "Could not load following"
-                )
 
-        elif action.startswith("user_stats_"):
-            username = action.replace("user_stats_", "")
-            original_text, original_markup = await self._show_loading_preserve_content(
-                query.message, "Loading stats", "pulse"
+        elif kind == "user_stats":
+            await self._run_preserving_content(
+                message, "Could not load stats",
+                lambda: self.stats.show_contribution_stats(message, username, context),
             )
-            try:
-                await self.stats.show_contribution_stats(query.message, username, context)
-            except Exception as e:
-                await self._show_error_preserve_content(
-                    query.message, original_text, original_markup, "Could not load stats"
-                )
 
-        elif action.startswith("show_avatar_"):
-            username = action.replace("show_avatar_", "")
-            original_text, original_markup = await self._show_loading_preserve_content(
-                query.message, "Loading avatar", "magic"
-            )
+        elif kind == "show_avatar":
+            # The profile message is deleted as soon as the photo starts sending, so a
+            # loading line on it would barely be seen; the callback toast covers the wait
+            original_text, original_markup = self._current_content(message)
             try:
-                await self._show_avatar_replace_message(query.message, username, context, original_text, original_markup)
+                await self._show_avatar_replace_message(message, username, context, original_text, original_markup)
             except Exception as e:
                 await self._show_error_preserve_content(
-                    query.message, original_text, original_markup, "Could not load avatar"
+                    message, original_text, original_markup, "Could not load avatar"
                 )
 
-        elif action.startswith("refresh_user_"):
-            username = action.replace("refresh_user_", "")
-            await self.display.refresh_user_profile(query.message, username, context)
+        elif kind == "refresh_user":
+            await self.display.refresh_user_profile(message, username, context)
 
         elif action == "back_to_profile":
             await self._handle_back_to_profile(query, context)
 
         else:
-            original_text, original_markup = await self._show_loading_preserve_content(
-                query.message, "Processing", "bounce"
-            )
+            original_text, original_markup = self._current_content(message)
             await self._show_error_preserve_content(
-                query.message, original_text, original_markup, "Unknown command"
+                message, original_text, original_markup, "Unknown command"
             )
 
     # ==================== LOADING AND ERROR HELPERS ====================
 
-    async def _show_loading_preserve_content(self, message, action, animation_type="pulse"):
-        """Show loading while preserving existing content"""
-        original_text = message.text if hasattr(message, 'text') else message.caption
-        original_markup = message.reply_markup
+    @staticmethod
+    def _current_content(message):
+        """Text (or caption) and keyboard currently shown by a message"""
+        original_text = message.text if message.text is not None else message.caption
+        return original_text, message.reply_markup
+
+    async def _edit_content(self, message, text, markup):
+        """Replace a message's text, or its caption for photo messages"""
+        await self._edit_if_changed(message, text, markup, caption=message.text is None)
+
+    async def _edit_if_changed(self, message, text, markup, caption=False):
+        """Edit a message unless it already shows exactly this content"""
+        key = (message.chat_id, message.message_id)
+        render = hash((text, repr(markup)))
+        shown = message.caption if caption else message.text
+
+        # Only skip when our last edit is also what the message still shows,
+        # so edits made elsewhere in between are never mistaken for a no-op
+        if self._last_render.get(key) == (render, shown):
+            return
 
-        # Create temporary loading message
-        loading_text = f"{original_text}\n\n💫 {action}..."
+        if caption:
+            result = await message.edit_caption(
+                caption=text,
+                reply_markup=markup,
+            )
+        else:
+            result = await message.edit_text(
+                text,
+                reply_markup=markup,
+            )
+
+        self._last_render[key] = (render, getattr(result, "caption" if caption else "text", None))
+        self._last_render.move_to_end(key)
+        if len(self._last_render) > RENDER_CACHE_SIZE:
+            self._last_render.popitem(last=False)
 
+    async def _run_preserving_content(self, message, error_label, show):
+        """Run show(), restoring the current content with an error if that fails"""
+        # List and stats views draw their own loading state straight away and the
+        # callback toast already acknowledged the tap, so no interim edit is made here
+        original_text, original_markup = self._current_content(message)
         try:
-            if hasattr(message, 'text'):
-                await message.edit_text(
-                    loading_text,
-                    parse_mode="Markdown",
-                    reply_markup=original_markup,
-                    disable_web_page_preview=True,
-                )
-            else:
-                await message.edit_caption(
-                    caption=loading_text,
-                    parse_mode="Markdown",
-                    reply_markup=original_markup,
-                )
+            await show()
         except Exception:
-            pass  # If edit fails, continue anyway
-
-        return original_text, original_markup
+            await self._show_error_preserve_content(
+                message, original_text, original_markup, error_label
+            )
 
     async def _show_error_preserve_content(self, message, original_text, original_markup, error_msg):
         """Show error at bottom of existing content"""
         error_text = f"{original_text}\n\n❌ {error_msg} - Try again"
 
         try:
-            if hasattr(message, 'text'):
-                await message.edit_text(
-                    error_text,
-                    parse_mode="Markdown",
-                    reply_markup=original_markup,
-                    disable_web_page_preview=True,
-                )
-            else:
-                await message.edit_caption(
-                    caption=error_text,
-                    parse_mode="Markdown",
-                    reply_markup=original_markup,
-                )
+            await self._edit_content(message, error_text, original_markup)
         except Exception:
             pass
 
@@ -361,7 +409,8 @@ class ProfileHandler:
     async def _show_avatar_replace_message(self, message, username, context, original_text, original_markup):
         """Replace profile message with avatar image (Option 2)"""
         try:
-            user_data = context.user_data.get("current_user")
+            state = get_profile_state(context)
+            user_data = state.user
 
             if not user_data:
                 await self._show_error_preserve_content(
@@ -378,75 +427,66 @@ class ProfileHandler:
                 return
 
             # Store original message info for back navigation
-            context.user_data["original_profile_text"] = original_text
-            context.user_data["original_profile_markup"] = original_markup
-            context.user_data["chat_id"] = message.chat_id
-            context.user_data["current_view"] = "avatar"
-
-            # Small delay to show loading animation
-            await asyncio.sleep(0.5)
-
-            # Delete the original profile message
-            await message.delete()
-
-            # Send avatar image in its place
-            large_avatar_url = f"{avatar_url}&s=400"
-
-            avatar_message = await message.chat.send_photo(
-                photo=large_avatar_url,
-                caption=f"👤 **{username}'s GitHub Avatar**\n\n📸 Profile picture displayed!\n\n💡 **Tip:** Use the buttons below to navigate!",
-                parse_mode="Markdown",
-                reply_markup=InlineKeyboardMarkup([
-                    [
-                        InlineKeyboardButton("🏠 Back to Profile", callback_data="back_to_profile"),
-                        InlineKeyboardButton("🔄 Refresh Avatar", callback_data=f"refresh_avatar_{username}")
-                    ],
-                    [
-                        InlineKeyboardButton("📂 Repositories", callback_data=f"user_repos_{username}"),
-                        InlineKeyboardButton("⭐ Starred", callback_data=f"user_starred_{username}")
-                    ],
-                    [
-                        InlineKeyboardButton("👥 Followers", callback_data=f"user_followers_{username}"),
-                        InlineKeyboardButton("👤 Following", callback_data=f"user_following_{username}")
-                    ],
-                    [
-                        InlineKeyboardButton("⬅️ Back to Start", callback_data="back_to_start")
-                    ]
-                ])
-            )
+            state.original_text = original_text
+            state.original_markup = original_markup
+            state.chat_id = message.chat_id
+            state.view = "avatar"
+
+            # Delete the original profile message while the avatar is sent in its place
+            delete_task = asyncio.create_task(message.delete())
+            try:
+                avatar_message = await message.chat.send_photo(
+                    photo=self._avatar_photo(state, avatar_url),
+                    caption=f"👤 **{username}'s GitHub Avatar**\n\n📸 Profile picture displayed!\n\n💡 **Tip:** Use the buttons below to navigate!",
+                    reply_markup=_avatar_markup(username)
+                )
+            finally:
+                await asyncio.gather(delete_task, return_exceptions=True)
 
             # Store avatar message for future operations
-            context.user_data["avatar_message"] = avatar_message
-            context.user_data["avatar_message_id"] = avatar_message.message_id
+            self._remember_avatar_photo(state, avatar_url, avatar_message)
+            state.avatar_message_id = avatar_message.message_id
 
         except Exception as e:
-            logger.error(f"Avatar replace failed: {type(e).__name__}")
+            logger.error("Avatar replace failed: %s", type(e).__name__)
             await self._show_error_preserve_content(
                 message, original_text, original_markup, "Avatar display failed"
             )
 
+    @staticmethod
+    def _avatar_photo(state, avatar_url):
+        """Photo to send for an avatar: Telegram's file_id if this URL was sent before"""
+        sent_url, file_id = state.avatar_photo or (None, None)
+        if sent_url == avatar_url:
+            return file_id
+        return _avatar_cdn(avatar_url)
+
+    @staticmethod
+    def _remember_avatar_photo(state, avatar_url, avatar_message):
+        """Keep the file_id of a sent avatar so Telegram need not download it again"""
+        if avatar_message.photo:
+            state.avatar_photo = (avatar_url, avatar_message.photo[-1].file_id)
+
     async def _handle_back_to_profile(self, query, context):
         """Handle back to profile with loading animation"""
-        current_view = context.user_data.get("current_view", "profile")
+        state = get_profile_state(context)
 
-        if current_view == "avatar":
+        if state.view == "avatar":
             # We're coming back from avatar view
             await self._restore_profile_from_avatar(query, context)
         else:
             # Regular back to profile
-            user_data = context.user_data.get("current_user")
-            username = context.user_data.get("current_username", "Unknown")
-
-            if user_data:
-                await self.display.show_user_profile(query.message, user_data, context, username)
+            if state.user:
+                await self.display.show_user_profile(query.message, state.user, context, state.username or "Unknown")
             else:
                 await self._show_session_lost(query.message)
 
     async def _restore_profile_from_avatar(self, query, context):
-        """Restore profile view from avatar with loading animation"""
+        """Restore profile view from avatar with loading animation, returning the new profile message"""
+        state = get_profile_state(context)
         try:
-            user_data = context.user_data.get("current_user")
-            username = context.user_data.get("current_username", "Unknown")
+            user_data = state.user
+            username = state.username or "Unknown"
 
             if not user_data:
                 await self._show_session_lost_avatar(query.message)
@@ -455,52 +495,45 @@ class ProfileHandler:
             # Show loading animation on avatar image
             await self._show_loading_on_avatar(query.message, "Returning to profile", "pulse")
 
-            # Small delay to show loading
-            await asyncio.sleep(0.5)
-
             # Delete avatar message
             await query.message.delete()
 
             # Send profile message back
-            chat_id = context.user_data.get("chat_id")
+            chat_id = state.chat_id
             if chat_id:
-                from telegram import Bot
                 bot = context.bot
 
-                # Retrieve original text/markup from context, if available
-                original_profile_text = context.user_data.get("original_profile_text", f"👤 **{username}'s Profile**\n\n")
-                original_profile_markup = context.user_data.get("original_profile_markup")
+                # Retrieve original text/markup from the profile state, if available
+                original_profile_text = state.original_text or f"👤 **{username}'s Profile**\n\n"
+                original_profile_markup = state.original_markup
 
                 profile_message = await bot.send_message(
                     chat_id=chat_id,
                     text=f"{original_profile_text}\n\n💫 Restoring profile...",
-                    parse_mode="Markdown",
                     reply_markup=original_profile_markup # Attempt to restore original markup
                 )
 
                 # Update context
-                context.user_data["current_view"] = "profile"
+                state.view = "profile"
 
                 # Show the full profile - this will edit the newly sent message
                 await self.display.show_user_profile(profile_message, user_data, context, username)
+                return profile_message
 
         except Exception as e:
-            logger.error(f"Profile restore failed: {type(e).__name__} - {e}", exc_info=True)
+            logger.error("Profile restore failed: %s - %s", type(e).__name__, e, exc_info=True)
             # Fallback - try to show profile anyway
             try:
-                chat_id = context.user_data.get("chat_id")
+                chat_id = state.chat_id
                 if chat_id:
-                    from telegram import Bot
                     bot = context.bot
                     error_message = await bot.send_message(
                         chat_id=chat_id,
                         text="❌ Error restoring profile. Please search again.",
-                        reply_markup=InlineKeyboardMarkup([[
-                            InlineKeyboardButton("⬅️ Back to Start", callback_data="back_to_start")
-                        ]])
+                        reply_markup=_BACK_TO_START_MARKUP
                     )
             except Exception as e_fallback:
-                logger.error(f"Final fallback error in profile restore: {type(e_fallback).__name__} - {e_fallback}")
+                logger.error("Final fallback error in profile restore: %s - %s", type(e_fallback).__name__, e_fallback)
 
     async def _show_loading_on_avatar(self, message, action, animation_type="magic"):
         """Show loading animation on avatar message"""
@@ -511,7 +544,6 @@ class ProfileHandler:
 
             await message.edit_caption(
                 caption=loading_caption,
-                parse_mode="Markdown",
                 reply_markup=message.reply_markup
             )
         except Exception:
@@ -520,77 +552,56 @@ class ProfileHandler:
     async def _handle_refresh_avatar(self, query, context, username):
         """Handle avatar refresh with loading animation"""
         try:
-            # Show loading on avatar
-            await self._show_loading_on_avatar(query.message, "Refreshing avatar", "magic")
-
-            # Fetch fresh user data
-            from utils.git_api import _make_request_with_retry
-
-            timeout = aiohttp.ClientTimeout(total=10, connect=5)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                    user_data = await _make_request_with_retry(
-                    session, f"/users/{username}", timeout=8
-                )
+            # Show loading on avatar while fresh user data is fetched, bypassing the
+            # cached record; the edit finishes before the message is touched again
+            loading_edit = asyncio.create_task(
+                self._show_loading_on_avatar(query.message, "Refreshing avatar", "magic")
+            )
+            try:
+                user_data = await self.display.get_user(username, refresh=True)
+            finally:
+                await loading_edit
 
             if not user_data:
                 # Show error on avatar
                 error_caption = f"{query.message.caption}\n\n❌ Refresh failed - Try again"
                 await query.message.edit_caption(
                     caption=error_caption,
-                    parse_mode="Markdown",
                     reply_markup=query.message.reply_markup
                 )
                 return
 
             # Update context with fresh data
-            context.user_data["current_user"] = user_data
+            state = get_profile_state(context)
+            state.user = user_data
 
             # Get new avatar URL
             new_avatar_url = user_data.get("avatar_url")
 
             if new_avatar_url:
-                # Update avatar image
-                large_avatar_url = f"{new_avatar_url}&s=400"
-
-                # Delete old avatar
-                await query.message.delete()
-
-                # Send fresh avatar
-                new_avatar_message = await query.message.chat.send_photo(
-                    photo=large_avatar_url,
-                    caption=f"👤 **{username}'s GitHub Avatar**\n\n📸 Profile picture refreshed!\n\n💡 **Tip:** Avatar updated successfully!",
-                    parse_mode="Markdown",
-                    reply_markup=InlineKeyboardMarkup([
-                        [
-                            InlineKeyboardButton("🏠 Back to Profile", callback_data="back_to_profile"),
-                            InlineKeyboardButton("🔄 Refresh Avatar", callback_data=f"refresh_avatar_{username}")
-                        ],
-                        [
-                            InlineKeyboardButton("📂 Repositories", callback_data=f"user_repos_{username}"),
-                            InlineKeyboardButton("⭐ Starred", callback_data=f"user_starred_{username}")
-                        ],
-                        [
-                            InlineKeyboardButton("👥 Followers", callback_data=f"user_followers_{username}"),
-                            InlineKeyboardButton("👤 Following", callback_data=f"user_following_{username}")
-                        ],
-                        [
-                            InlineKeyboardButton("⬅️ Back to Start", callback_data="back_to_start")
-                        ]
-                    ])
-                )
+                # Delete old avatar while the fresh one is sent; the avatar URL stays the
+                # same when a user changes their picture, so refresh always asks the CDN
+                delete_task = asyncio.create_task(query.message.delete())
+                try:
+                    new_avatar_message = await query.message.chat.send_photo(
+                        photo=_avatar_cdn(new_avatar_url),
+                        caption=f"👤 **{username}'s GitHub Avatar**\n\n📸 Profile picture refreshed!\n\n💡 **Tip:** Avatar updated successfully!",
+                        reply_markup=_avatar_markup(username)
+                    )
+                finally:
+                    await asyncio.gather(delete_task, return_exceptions=True)
 
                 # Update stored avatar message
-                context.user_data["avatar_message"] = new_avatar_message
-                context.user_data["avatar_message_id"] = new_avatar_message.message_id
+                self._remember_avatar_photo(state, new_avatar_url, new_avatar_message)
+                state.avatar_message_id = new_avatar_message.message_id
 
         except Exception as e:
-            logger.error(f"Avatar refresh failed: {type(e).__name__}")
+            logger.error("Avatar refresh failed: %s", type(e).__name__)
             # Show error on avatar
             try:
                 error_caption = f"{query.message.caption}\n\n❌ Refresh failed - Try again"
                 await query.message.edit_caption(
                     caption=error_caption,
-                    parse_mode="Markdown",
                     reply_markup=query.message.reply_markup
                 )
             except Exception:
@@ -600,13 +611,7 @@ class ProfileHandler:
         """Show session lost error on avatar page"""
         try:
             error_caption = f"{message.caption}\n\n❌ Session expired"
-            await message.edit_caption(
-                caption=error_caption,
-                parse_mode="Markdown",
-                reply_markup=InlineKeyboardMarkup([[
-                    InlineKeyboardButton("⬅️ Back to Start", callback_data="back_to_start")
-                ]])
-            )
+            await self._edit_if_changed(message, error_caption, _BACK_TO_START_MARKUP, caption=True)
         except Exception:
             pass
 
@@ -614,112 +619,44 @@ class ProfileHandler:
 
     async def _show_user_not_found(self, message, username):
         """Show user not found error - preserves window"""
-        error_text = f"👤 **User Search**\n\n"
-        error_text += f"❌ **User Not Found**\n\n"
-        error_text += f"User `{username}` not found on GitHub.\n\n"
-        error_text += f"**Possible reasons:**\n"
-        error_text += f"• Username doesn't exist\n"
-        error_text += f"• Account was deleted\n"
-        error_text += f"• Typo in username\n\n"
-        error_text += f"💡 **Tip:** Double-check the username spelling!"
-
-        keyboard = [
-            [InlineKeyboardButton("⬅️ Back to Start", callback_data="back_to_start")]
-        ]
+        error_text = _USER_NOT_FOUND_TEMPLATE.format(username=username)
 
         try:
-            await message.edit_text(
-                error_text,
-                parse_mode="Markdown",
-                reply_markup=InlineKeyboardMarkup(keyboard),
-                disable_web_page_preview=True,
-            )
+            await self._edit_if_changed(message, error_text, _BACK_TO_START_MARKUP)
         except Exception as e:
-            logger.warning(f"User not found display failed: {type(e).__name__}")
+            logger.warning("User not found display failed: %s", type(e).__name__)
 
     async def _show_search_error(self, message, username):
         """Show search error - preserves window"""
-        error_text = f"👤 **{username}'s Profile**\n\n"
-        error_text += f"❌ **Search Error**\n\n"
-        error_text += f"Unable to search for user profile.\n\n"
-        error_text += f"**Possible causes:**\n"
-        error_text += f"• Network connection issues\n"
-        error_text += f"• GitHub API temporary unavailable\n"
-        error_text += f"• Rate limiting\n\n"
-        error_text += f"💡 **Tip:** Wait a moment and try again!"
-
-        keyboard = [
-            [
-                InlineKeyboardButton("🔄 Retry", callback_data=f"refresh_user_{username}"),
-                InlineKeyboardButton("⬅️ Back to Start", callback_data="back_to_start"),
-            ]
-        ]
+        error_text = _SEARCH_ERROR_TEMPLATE.format(username=username)
 
         try:
-            await message.edit_text(
-                error_text,
-                parse_mode="Markdown",
-                reply_markup=InlineKeyboardMarkup(keyboard),
-                disable_web_page_preview=True,
-            )
+            await self._edit_if_changed(message, error_text, _search_error_markup(username))
         except Exception as e:
-            logger.warning(f"Search error display failed: {type(e).__name__}")
+            logger.warning("Search error display failed: %s", type(e).__name__)
 
     async def _show_callback_error(self, message, action, error_type="Action Error"):
         """Show callback error - preserves window"""
         # Extract username from action if possible
-        username = "Unknown"
-        for prefix in [
-            "user_repos_", "user_starred_", "user_followers_",
-            "user_following_", "user_stats_", "show_avatar_",
-        ]:
-            if action.startswith(prefix):
-                username = action.replace(prefix, "").split("_page_")[0]
-                break
-
-        error_text = f"👤 **{username}'s Profile**\n\n"
-        error_text += f"❌ **{error_type}**\n\n"
-        error_text += f"Something went wrong with this action.\n\n"
-        error_text += f"💡 **Tip:** Try the action again or go back to profile!"
-
-        keyboard = [
-            [
-                InlineKeyboardButton("🔄 Try Again", callback_data=action),
-                InlineKeyboardButton("🏠 Back to Profile", callback_data="back_to_profile"),
-            ],
-            [InlineKeyboardButton("⬅️ Back to Start", callback_data="back_to_start")],
-        ]
+        kind, username = _split_action(action.partition("_page_")[0])
+        if kind not in _USER_ACTION_KINDS:
+            username = "Unknown"
+
+        error_text = _CALLBACK_ERROR_TEMPLATE.format(username=username, error_type=error_type)
 
         try:
-            await message.edit_text(
-                error_text,
-                parse_mode="Markdown",
-                reply_markup=InlineKeyboardMarkup(keyboard),
-                disable_web_page_preview=True,
-            )
+            await self._edit_if_changed(message, error_text, _callback_error_markup(action))
         except Exception as e:
-            logger.warning(f"Callback error display failed: {type(e).__name__}")
+            logger.warning("Callback error display failed: %s", type(e).__name__)
 
     async def _show_session_lost(self, message):
         """Show session lost error - preserves window"""
-        error_text = f"👤 **User Profile**\n\n"
-        error_text += f"❌ **Session Expired**\n\n"
-        error_text += f"Your session has expired or profile data was lost.\n\n"
-        error_text += f"💡 **Tip:** Search for the user again!"
-
-        keyboard = [
-            [InlineKeyboardButton("⬅️ Back to Start", callback_data="back_to_start")]
-        ]
+        error_text = _SESSION_LOST_TEXT
 
         try:
-            await message.edit_text(
-                error_text,
-                parse_mode="Markdown",
-                reply_markup=InlineKeyboardMarkup(keyboard),
-                disable_web_page_preview=True,
-            )
+            await self._edit_if_changed(message, error_text, _BACK_TO_START_MARKUP)
         except Exception as e:
-            logger.warning(f"Session lost display failed: {type(e).__name__}")
+            logger.warning("Session lost display failed: %s", type(e).__name__)
 
     def get_handler_stats(self):
         """Get basic handler statistics for monitoring"""
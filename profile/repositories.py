@@ -1,10 +1,9 @@
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-import aiohttp
 import logging
-import asyncio
 
 # Import the loading system
-from utils.loading import show_loading, show_error, show_static_loading
+from utils.loading import show_loading, show_error, show_static_loading, stop_loading
+from utils.git_api import _make_request_with_retry, get_github_session
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +13,19 @@ class ProfileRepositories:
         self.REPOS_ANIMATION = "rocket"  # Rocket animation for repositories
         self.STARRED_ANIMATION = "stars"  # Stars animation for starred repos
 
+    async def prefetch_user_repos(self, username, per_page=10):
+        """Warm the API cache with the first repositories page, usually the next thing opened"""
+        try:
+            # Same request show_user_repos makes first, so it is answered from the cache
+            await _make_request_with_retry(
+                get_github_session(),
+                f"/users/{username}/repos",
+                params={"sort": "updated", "per_page": per_page, "page": 1, "type": "owner"},
+                timeout=12,
+            )
+        except Exception as e:
+            logger.debug("Repository prefetch failed for %s: %s", username, type(e).__name__)
+
     async def show_user_repos(self, message, username, context, page=1):
         """Show user's public repositories with loading animation and pagination"""
         per_page = 10
@@ -38,136 +50,122 @@ class ProfileRepositories:
         )
 
         try:
-            from utils.git_api import _make_request_with_retry
-
-            # Use longer timeout for repositories
-            timeout = aiohttp.ClientTimeout(total=15, connect=8)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                # Get user info first to check repo count
-                user_info = await _make_request_with_retry(
-                    session, f"/users/{username}", timeout=10
-                )
+            session = get_github_session()
+            # Get user info first to check repo count
+            user_info = await _make_request_with_retry(
+                session, f"/users/{username}", timeout=10
+            )
 
-                # Stop loading animation gracefully
-                if loading_task and not loading_task.done():
-                    loading_task.cancel()
-                    try:
-                        await loading_task
-                    except asyncio.CancelledError:
-                        pass
+            # Stop loading animation gracefully
+            await stop_loading(loading_task)
 
-                if not user_info:
-                    await self._show_data_error(message, username, "repositories", page)
-                    return
+            if not user_info:
+                await self._show_data_error(message, username, "repositories", page)
+                return
 
-                total_repos = user_info.get("public_repos", 0)
+            total_repos = user_info.get("public_repos", 0)
 
-                if total_repos == 0:
-                    await self._show_no_repos(message, username)
-                    return
+            if total_repos == 0:
+                await self._show_no_repos(message, username)
+                return
 
-                # Get repositories with multiple sort options
-                sort_options = ["updated", "stars", "created"]
-                repos = None
+            # Get repositories with multiple sort options
+            sort_options = ["updated", "stars", "created"]
+            repos = None
 
-                for sort_by in sort_options:
-                    try:
-                        repos = await _make_request_with_retry(
-                            session,
-                            f"/users/{username}/repos",
-                            params={
-                                "sort": sort_by,
-                                "per_page": per_page,
-                                "page": page,
-                                "type": "owner",  # Only show owned repos
-                            },
-                            timeout=12,
-                        )
-                        if repos:
-                            break
-                    except Exception:
-                        continue
-
-                if not repos:
-                    await self._show_network_error(message, username, "repositories", page)
-                    return
-
-                # Calculate pagination
-                total_pages = (total_repos + per_page - 1) // per_page
-                start_index = (page - 1) * per_page + 1
-                end_index = min(start_index + len(repos) - 1, total_repos)
-
-                # Format repositories
-                text = f"📂 **{username}'s Repositories**\n"
-                text += f"📊 Showing {start_index}-{end_index} of {total_repos:,} total\n"
-                if total_pages > 1:
-                    text += f"📄 Page {page} of {total_pages}\n"
-                text += "\n"
-
-                for i, repo in enumerate(repos, 1):
-                    name = repo.get("name", "Unknown")
-                    description = repo.get("description", "No description")
-                    stars = repo.get("stargazers_count", 0)
-                    forks = repo.get("forks_count", 0)
-                    language = repo.get("language", "Unknown")
-                    updated = repo.get("updated_at", "")
-                    is_private = repo.get("private", False)
-                    is_fork = repo.get("fork", False)
-
-                    # Truncate description
-                    if description and len(description) > 60:
-                        description = description[:60] + "..."
-
-                    # Format updated date
-                    updated_str = ""
-                    if updated:
-                        try:
-                            from datetime import datetime
-                            updated_date = datetime.strptime(updated, "%Y-%m-%dT%H:%M:%SZ")
-                            updated_str = updated_date.strftime("%b %d")
-                        except Exception:
-                            pass
-
-                    # Add repo info
-                    repo_emoji = "🔒" if is_private else "🍴" if is_fork else "📦"
-                    text += f"{repo_emoji} **{name}**\n"
-                    text += f"   {description}\n"
-
-                    # Stats line
-                    stats_line = f"   ⭐ {stars}"
-                    if forks > 0:
-                        stats_line += f" • 🍴 {forks}"
-                    if language != "Unknown":
-                        stats_line += f" • 💻 {language}"
-                    if updated_str:
-                        stats_line += f" • 🕒 {updated_str}"
-                    text += stats_line + "\n"
-                    text += f"   `{username}/{name}`\n\n"
-
-                text += "💡 **Tip:** Copy any repository name to explore!"
-
-                # Create navigation buttons
-                keyboard = self._create_repos_keyboard(username, page, total_pages)
-
-                # Update with final content while preserving the window
+            for sort_by in sort_options:
                 try:
-                    await message.edit_text(
-                        text,
-                        parse_mode="Markdown",
-                        reply_markup=InlineKeyboardMarkup(keyboard),
-                        disable_web_page_preview=True,
+                    repos = await _make_request_with_retry(
+                        session,
+                        f"/users/{username}/repos",
+                        params={
+                            "sort": sort_by,
+                            "per_page": per_page,
+                            "page": page,
+                            "type": "owner",  # Only show owned repos
+                        },
+                        timeout=12,
                     )
-                except Exception as edit_error:
-                    logger.warning(f"Message edit failed: {type(edit_error).__name__}")
+                    if repos:
+                        break
+                except Exception:
+                    continue
+
+            if not repos:
+                await self._show_network_error(message, username, "repositories", page)
+                return
+
+            # Calculate pagination
+            total_pages = (total_repos + per_page - 1) // per_page
+            start_index = (page - 1) * per_page + 1
+            end_index = min(start_index + len(repos) - 1, total_repos)
+
+            # Format repositories
+            text = f"📂 **{username}'s Repositories**\n"
+            text += f"📊 Showing {start_index}-{end_index} of {total_repos:,} total\n"
+            if total_pages > 1:
+                text += f"📄 Page {page} of {total_pages}\n"
+            text += "\n"
+
+            for i, repo in enumerate(repos, 1):
+                name = repo.get("name", "Unknown")
+                description = repo.get("description", "No description")
+                stars = repo.get("stargazers_count", 0)
+                forks = repo.get("forks_count", 0)
+                language = repo.get("language", "Unknown")
+                updated = repo.get("updated_at", "")
+                is_private = repo.get("private", False)
+                is_fork = repo.get("fork", False)
+
+                # Truncate description
+                if description and len(description) > 60:
+                    description = description[:60] + "..."
+
+                # Format updated date
+                updated_str = ""
+                if updated:
+                    try:
+                        from datetime import datetime
+                        updated_date = datetime.strptime(updated, "%Y-%m-%dT%H:%M:%SZ")
+                        updated_str = updated_date.strftime("%b %d")
+                    except Exception:
+                        pass
+
+                # Add repo info
+                repo_emoji = "🔒" if is_private else "🍴" if is_fork else "📦"
+                text += f"{repo_emoji} **{name}**\n"
+                text += f"   {description}\n"
+
+                # Stats line
+                stats_line = f"   ⭐ {stars}"
+                if forks > 0:
+                    stats_line += f" • 🍴 {forks}"
+                if language != "Unknown":
+                    stats_line += f" • 💻 {language}"
+                if updated_str:
+                    stats_line += f" • 🕒 {updated_str}"
+                text += stats_line + "\n"
+                text += f"   `{username}/{name}`\n\n"
+
+            text += "💡 **Tip:** Copy any repository name to explore!"
+
+            # Create navigation buttons
+            keyboard = self._create_repos_keyboard(username, page, total_pages)
+
+            # Update with final content while preserving the window
+            try:
+                await message.edit_text(
+                    text,
+                    parse_mode="Markdown",
+                    reply_markup=InlineKeyboardMarkup(keyboard),
+                    disable_web_page_preview=True,
+                )
+            except Exception as edit_error:
+                logger.warning(f"Message edit failed: {type(edit_error).__name__}")
 
         except Exception as e:
             # Stop loading animation gracefully
-            if loading_task and not loading_task.done():
-                loading_task.cancel()
-                try:
-                    await loading_task
-                except asyncio.CancelledError:
-                    pass
+            await stop_loading(loading_task)
 
             # Log minimal error info
             logger.error(f"Repos error for {username}: {type(e).__name__}")
@@ -197,95 +195,82 @@ class ProfileRepositories:
         )
 
         try:
-            from utils.git_api import _make_request_with_retry
-
-            timeout = aiohttp.ClientTimeout(total=15, connect=8)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                # Get starred repos
-                starred = await _make_request_with_retry(
-                    session,
-                    f"/users/{username}/starred",
-                    params={"per_page": per_page, "page": page},
-                    timeout=12,
-                )
+            session = get_github_session()
+            # Get starred repos
+            starred = await _make_request_with_retry(
+                session,
+                f"/users/{username}/starred",
+                params={"per_page": per_page, "page": page},
+                timeout=12,
+            )
 
-                # Stop loading animation gracefully
-                if loading_task and not loading_task.done():
-                    loading_task.cancel()
-                    try:
-                        await loading_task
-                    except asyncio.CancelledError:
-                        pass
+            # Stop loading animation gracefully
+            await stop_loading(loading_task)
 
-                if not starred or len(starred) == 0:
-                    await self._show_no_starred(message, username, page)
-                    return
-
-                # Format starred repos
-                text = f"⭐ **{username}'s Starred Repositories**\n"
-                text += f"📊 Showing {len(starred)} repositories\n"
-                if page > 1:
-                    text += f"📄 Page {page}\n"
-                text += "\n"
-
-                for i, repo in enumerate(starred, 1):
-                    name = repo.get("full_name", "Unknown")
-                    description = repo.get("description", "No description")
-                    stars = repo.get("stargazers_count", 0)
-                    language = repo.get("language", "Unknown")
-
-                    # Truncate description
-                    if description and len(description) > 50:
-                        description = description[:50] + "..."
-
-                    # Format stars
-                    if stars >= 1000:
-                        stars_fmt = f"{stars/1000:.1f}k"
-                    else:
-                        stars_fmt = str(stars)
-
-                    text += f"{i}. **{name}**\n"
-                    text += f"   {description}\n"
-                    text += f"   ⭐ {stars_fmt} • 💻 {language}\n"
-                    text += f"   `{name}`\n\n"
-
-                text += "💡 **Tip:** These are repositories that caught their attention!"
-
-                keyboard = [
-                    [
-                        InlineKeyboardButton(
-                            "🔄 Refresh", callback_data=f"user_starred_{username}"
-                        ),
-                        InlineKeyboardButton(
-                            "📂 Repositories", callback_data=f"user_repos_{username}"
-                        ),
-                    ],
-                    [
-                        InlineKeyboardButton(
-                            "⬅️ Back to Profile", callback_data="back_to_profile"
-                        )
-                    ],
-                ]
-
-                # Update with final content while preserving the window
-                try:
-                    await message.edit_text(
-                        text,
-                        parse_mode="Markdown",
-                        reply_markup=InlineKeyboardMarkup(keyboard),
-                        disable_web_page_preview=True,
+            if not starred or len(starred) == 0:
+                await self._show_no_starred(message, username, page)
+                return
+
+            # Format starred repos
+            text = f"⭐ **{username}'s Starred Repositories**\n"
+            text += f"📊 Showing {len(starred)} repositories\n"
+            if page > 1:
+                text += f"📄 Page {page}\n"
+            text += "\n"
+
+            for i, repo in enumerate(starred, 1):
+                name = repo.get("full_name", "Unknown")
+                description = repo.get("description", "No description")
+                stars = repo.get("stargazers_count", 0)
+                language = repo.get("language", "Unknown")
+
+                # Truncate description
+                if description and len(description) > 50:
+                    description = description[:50] + "..."
+
+                # Format stars
+                if stars >= 1000:
+                    stars_fmt = f"{stars/1000:.1f}k"
+                else:
+                    stars_fmt = str(stars)
+
+                text += f"{i}. **{name}**\n"
+                text += f"   {description}\n"
+                text += f"   ⭐ {stars_fmt} • 💻 {language}\n"
+                text += f"   `{name}`\n\n"
+
+            text += "💡 **Tip:** These are repositories that caught their attention!"
+
+            keyboard = [
+                [
+                    InlineKeyboardButton(
+                        "🔄 Refresh", callback_data=f"user_starred_{username}"
+                    ),
+                    InlineKeyboardButton(
+                        "📂 Repositories", callback_data=f"user_repos_{username}"
+                    ),
+                ],
+                [
+                    InlineKeyboardButton(
+                        "⬅️ Back to Profile", callback_data="back_to_profile"
                     )
-                except Exception as edit_error:
-                    logger.warning(f"Message edit failed: {type(edit_error).__name__}")
+                ],
+            ]
+
+            # Update with final content while preserving the window
+            try:
+                await message.edit_text(
+                    text,
+                    parse_mode="Markdown",
+                    reply_markup=InlineKeyboardMarkup(keyboard),
+                    disable_web_page_preview=True,
+                )
+            except Exception as edit_error:
+                logger.warning(f"Message edit failed: {type(edit_error).__name__}")
 
         except Exception as e:
             # Stop loading animation gracefully
-            if loading_task and not loading_task.done():
-                loading_task.cancel()
-                try:
-                    await loading_task
-                except asyncio.CancelledError:
-                    pass
+            await stop_loading(loading_task)
 
             # Log minimal error info
             logger.error(f"Starred repos error for {username}: {type(e).__name__}")
@@ -1,10 +1,10 @@
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-import aiohttp
 import logging
 import asyncio
 
 # Import the loading system
-from utils.loading import show_loading, show_error, show_static_loading
+from utils.loading import show_loading, show_error, show_static_loading, stop_loading
+from utils.git_api import _make_request_with_retry, get_github_session
 
 logger = logging.getLogger(__name__)
 
@@ -44,12 +44,7 @@ class ProfileSocial:
             )
 
             # Stop loading animation gracefully
-            if loading_task and not loading_task.done():
-                loading_task.cancel()
-                try:
-                    await loading_task
-                except asyncio.CancelledError:
-                    pass
+            await stop_loading(loading_task)
 
             if followers_data is None:
                 await self._show_network_error_inline(
@@ -112,12 +107,7 @@ class ProfileSocial:
 
         except Exception as e:
             # Stop loading animation gracefully
-            if loading_task and not loading_task.done():
-                loading_task.cancel()
-                try:
-                    await loading_task
-                except asyncio.CancelledError:
-                    pass
+            await stop_loading(loading_task)
 
             logger.error(
                 f"Error in show_followers for {username} page {page}: {e}",
@@ -155,12 +145,7 @@ class ProfileSocial:
             )
 
             # Stop loading animation gracefully
-            if loading_task and not loading_task.done():
-                loading_task.cancel()
-                try:
-                    await loading_task
-                except asyncio.CancelledError:
-                    pass
+            await stop_loading(loading_task)
 
             if following_data is None:
                 await self._show_network_error_inline(
@@ -223,12 +208,7 @@ class ProfileSocial:
 
         except Exception as e:
             # Stop loading animation gracefully
-            if loading_task and not loading_task.done():
-                loading_task.cancel()
-                try:
-                    await loading_task
-                except asyncio.CancelledError:
-                    pass
+            await stop_loading(loading_task)
 
             logger.error(
                 f"Error in show_following for {username} page {page}: {e}",
@@ -282,53 +262,45 @@ class ProfileSocial:
         self, username, endpoint, page, per_page, max_retries=3
     ):
         """Fetch data with multiple retry strategies"""
-        from utils.git_api import _make_request_with_retry
-
         retry_timeouts = [8, 12, 20]  # Progressive timeout
 
         for attempt in range(max_retries):
             try:
-                timeout = aiohttp.ClientTimeout(
-                    total=retry_timeouts[attempt],
-                    connect=5,
-                    sock_read=retry_timeouts[attempt] - 2,
+                session = get_github_session()
+                # Get user info and endpoint data
+                user_info_task = _make_request_with_retry(
+                    session, f"/users/{username}", timeout=retry_timeouts[attempt]
                 )
 
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    # Get user info and endpoint data
-                    user_info_task = _make_request_with_retry(
-                        session, f"/users/{username}", timeout=retry_timeouts[attempt]
-                    )
+                endpoint_task = _make_request_with_retry(
+                    session,
+                    f"/users/{username}/{endpoint}",
+                    params={"per_page": per_page, "page": page},
+                    timeout=retry_timeouts[attempt],
+                )
 
-                    endpoint_task = _make_request_with_retry(
-                        session,
-                        f"/users/{username}/{endpoint}",
-                        params={"per_page": per_page, "page": page},
+                # Wait for both requests with timeout
+                try:
+                    user_info, endpoint_data = await asyncio.wait_for(
+                        asyncio.gather(
+                            user_info_task, endpoint_task, return_exceptions=True
+                        ),
                         timeout=retry_timeouts[attempt],
                     )
 
-                    # Wait for both requests with timeout
-                    try:
-                        user_info, endpoint_data = await asyncio.wait_for(
-                            asyncio.gather(
-                                user_info_task, endpoint_task, return_exceptions=True
-                            ),
-                            timeout=retry_timeouts[attempt],
-                        )
-
-                        # Check if either request failed
-                        if isinstance(user_info, Exception):
-                            user_info = None
-                        if isinstance(endpoint_data, Exception):
-                            endpoint_data = None
-
-                        if endpoint_data is not None:
-                            return user_info, endpoint_data
-
-                    except asyncio.TimeoutError:
-                        logger.warning(
-                            f"Attempt {attempt + 1} timed out for {username} {endpoint}"
-                        )
+                    # Check if either request failed
+                    if isinstance(user_info, Exception):
+                        user_info = None
+                    if isinstance(endpoint_data, Exception):
+                        endpoint_data = None
+
+                    if endpoint_data is not None:
+                        return user_info, endpoint_data
+
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        f"Attempt {attempt + 1} timed out for {username} {endpoint}"
+                    )
 
             except Exception as e:
                 logger.warning(
@@ -0,0 +1,26 @@
+# profile/state.py
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+PROFILE_STATE_KEY = "profile_state"
+
+
+@dataclass(slots=True)
+class ProfileState:
+    """Profile navigation state for one Telegram user, kept under a single user_data key"""
+    user: Optional[dict] = None  # GitHub user record of the profile being shown
+    username: str = ""
+    view: str = "profile"  # "profile" or "avatar"
+    chat_id: Optional[int] = None
+    avatar_message_id: Optional[int] = None
+    avatar_photo: Optional[Tuple[str, str]] = None  # (avatar URL, Telegram file_id)
+    original_text: Optional[str] = None  # Profile text to restore when leaving the avatar
+    original_markup: Any = None
+
+
+def get_profile_state(context):
+    """Profile state of the user behind context, created on first use"""
+    state = context.user_data.get(PROFILE_STATE_KEY)
+    if state is None:
+        state = context.user_data[PROFILE_STATE_KEY] = ProfileState()
+    return state
@@ -1,13 +1,20 @@
 import os
-import base64
 import aiohttp
 import logging
 import asyncio
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any, Callable
 from functools import lru_cache
 from dotenv import load_dotenv
 
+# orjson is optional; when installed it parses large responses several times faster
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 # Load environment variables
 load_dotenv()
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
@@ -19,10 +26,20 @@ HEADERS = {
     "User-Agent": "GitHub-Explorer-Bot/2.0"
 }
 
+# Media type for file contents (e.g. READMEs) as plain text instead of base64 JSON
+RAW_MEDIA_TYPE = "application/vnd.github.raw"
+
 # Add authorization header if token is provided
 if GITHUB_TOKEN:
     HEADERS["Authorization"] = f"token {GITHUB_TOKEN}"
 
+# Concurrent GitHub requests across the bot, to stay clear of secondary rate limits
+GITHUB_MAX_CONCURRENCY = int(os.getenv("GITHUB_MAX_CONCURRENCY", "20"))
+_request_slots = asyncio.Semaphore(GITHUB_MAX_CONCURRENCY)
+# Epoch seconds per rate limit resource ("core", "search", ...), set when GitHub
+# says that resource's limit is used up; search has a far smaller quota than core
+_rate_limited_until: Dict[str, float] = {}
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -30,6 +47,10 @@ logger = logging.getLogger(__name__)
 CACHE_TTL = 300  # 5 minutes cache TTL
 _cache = {}
 
+# ETags of recent responses, replayed as If-None-Match; 304 replies don't count against the rate limit
+ETAG_CACHE_SIZE = 256
+_etags = OrderedDict()
+
 class GitHubAPIError(Exception):
     """Custom exception for GitHub API errors"""
     pass
@@ -76,6 +97,43 @@ def _set_cache(key: str, data: Any):
         for old_key, _ in sorted_items[:20]:
             del _cache[old_key]
 
+def _get_etag(key: str) -> Optional[tuple]:
+    """Get the (etag, data) pair stored for a request, if any"""
+    entry = _etags.get(key)
+    if entry:
+        _etags.move_to_end(key)
+    return entry
+
+def _set_etag(key: str, etag: str, data: Any):
+    """Remember a response's ETag with its data, evicting the least recently used"""
+    _etags[key] = (etag, data)
+    _etags.move_to_end(key)
+    if len(_etags) > ETAG_CACHE_SIZE:
+        _etags.popitem(last=False)
+
+def _rate_limit_resource(path: str) -> str:
+    """Name of the GitHub rate limit resource a request path counts against"""
+    if path.startswith("/search/code"):
+        return "code_search"
+    if path.startswith("/search/"):
+        return "search"
+    return "core"
+
+def _hold_requests(resource: str, retry_after: Optional[str], reset_time: Optional[str]) -> Optional[int]:
+    """Hold back requests to a resource until its rate limit resets, returning that timestamp"""
+    try:
+        if retry_after:
+            resume_at = time.time() + int(retry_after)
+        elif reset_time:
+            resume_at = int(reset_time)
+        else:
+            return None
+    except ValueError:
+        return None
+
+    _rate_limited_until[resource] = max(_rate_limited_until.get(resource, 0.0), resume_at)
+    return int(resume_at)
+
 async def _make_request_with_retry(
     session: aiohttp.ClientSession,
     path: str,
@@ -83,18 +141,42 @@ async def _make_request_with_retry(
     timeout: int = 8,
     max_retries: int = 3,
     use_cache: bool = True,
-    progress_callback: Optional[Callable[[str], None]] = None
+    progress_callback: Optional[Callable[[str], None]] = None,
+    accept: Optional[str] = None
 ) -> Optional[Dict]:
-    """Make request with retry logic, caching, and better error handling"""
+    """Make request with retry logic, caching, and better error handling
+
+    With accept (e.g. RAW_MEDIA_TYPE) the response body is returned as text
+    rather than parsed as JSON.
+    """
     url = f"{GITHUB_API_BASE}{path}"
 
+    cache_key = _get_cache_key(path, params)
+    if accept:
+        cache_key = f"{cache_key}#{accept}"
+
     # Check cache first
     if use_cache:
-        cache_key = _get_cache_key(path, params)
         cached_data = _get_from_cache(cache_key)
         if cached_data:
             return cached_data
 
+    # Requests made before the rate limit resets would only be refused again
+    resource = _rate_limit_resource(path)
+    held_until = _rate_limited_until.get(resource, 0.0)
+    if time.time() < held_until:
+        raise RateLimitError("GitHub API rate limit exceeded", int(held_until))
+
+    # Revalidate a previous response instead of downloading it again
+    etag_entry = _get_etag(cache_key)
+    headers = HEADERS
+    if accept or etag_entry:
+        headers = {**HEADERS}
+        if accept:
+            headers["Accept"] = accept
+        if etag_entry:
+            headers["If-None-Match"] = etag_entry[0]
+
     for attempt in range(max_retries):
         try:
             if progress_callback and attempt > 0:
@@ -107,17 +189,35 @@ async def _make_request_with_retry(
                 sock_read=timeout - 2  # Socket read timeout
             )
 
-            async with session.get(
+            # Hold a slot only while the request is in flight, not during backoff
+            async with _request_slots, session.get(
                 url,
-                headers=HEADERS,
+                headers=headers,
                 params=params,
                 timeout=timeout_config,
                 ssl=False  # Skip SSL verification if needed
             ) as response:
 
                 if response.status == 200:
-                    data = await response.json()
+                    body = await response.read()
+                    if accept:
+                        data = body.decode("utf-8", errors="replace")
+                    else:
+                        try:
+                            data = _json_loads(body)
+                        except ValueError:
+                            raise GitHubAPIError(f"Invalid JSON response for {path}")
                     # Cache successful responses
+                    if use_cache:
+                        _set_cache(cache_key, data)
+                    etag = response.headers.get('ETag')
+                    if etag:
+                        _set_etag(cache_key, etag, data)
+                    return data
+
+                elif response.status == 304 and etag_entry:
+                    # Unchanged since the stored response
+                    data = etag_entry[1]
                     if use_cache:
                         _set_cache(cache_key, data)
                     return data
@@ -126,13 +226,16 @@ async def _make_request_with_retry(
                     logger.warning(f"GitHub API: Resource not found: {url}")
                     raise NotFoundError(f"Resource not found: {path}")
 
-                elif response.status == 403:
-                    # Extract rate limit info
+                elif response.status in (403, 429):
+                    # Extract rate limit info; secondary limits send Retry-After instead
                     remaining = response.headers.get('X-RateLimit-Remaining', '0')
                     reset_time = response.headers.get('X-RateLimit-Reset')
+                    retry_after = response.headers.get('Retry-After')
 
-                    if remaining == '0':
-                        reset_timestamp = int(reset_time) if reset_time else None
+                    if remaining == '0' or retry_after or response.status == 429:
+                        reset_timestamp = _hold_requests(
+                            response.headers.get('X-RateLimit-Resource', resource), retry_after, reset_time
+                        )
                         logger.warning(f"GitHub API: Rate limit exceeded. Reset at: {reset_timestamp}")
                         raise RateLimitError("GitHub API rate limit exceeded", reset_timestamp)
                     else:
@@ -151,17 +254,19 @@ async def _make_request_with_retry(
                     raise GitHubAPIError(error_detail)
 
                 elif response.status >= 500:
-                    if attempt < max_retries - 1:
-                        logger.warning(f"GitHub API: Server error {response.status}, retrying... (attempt {attempt + 1})")
-                        await asyncio.sleep(2 ** attempt)  # Exponential backoff
-                        continue
-                    raise GitHubAPIError(f"GitHub server error: {response.status}")
+                    if attempt == max_retries - 1:
+                        raise GitHubAPIError(f"GitHub server error: {response.status}")
+                    logger.warning(f"GitHub API: Server error {response.status}, retrying... (attempt {attempt + 1})")
 
                 else:
                     error_text = await response.text()
                     logger.warning(f"GitHub API: Unexpected status {response.status}: {error_text}")
                     raise GitHubAPIError(f"Unexpected error: {response.status}")
 
+            # Only a retryable server error gets here; back off with the slot
+            # and the response connection released
+            await asyncio.sleep(2 ** attempt)  # Exponential backoff
+
         except asyncio.TimeoutError:
             if attempt < max_retries - 1:
                 logger.warning(f"GitHub API: Request timeout, retrying... (attempt {attempt + 1})")
@@ -193,11 +298,12 @@ async def _make_request_with_retry(
 def create_github_session() -> aiohttp.ClientSession:
     """Create aiohttp session with optimized settings"""
     connector = aiohttp.TCPConnector(
-        limit=10,  # Total connection limit
-        limit_per_host=5,  # Per-host connection limit
+        limit=max(20, GITHUB_MAX_CONCURRENCY),  # Total connection limit
+        # Nearly every request goes to api.github.com, so let one host use all request slots
+        limit_per_host=GITHUB_MAX_CONCURRENCY,
         ttl_dns_cache=300,  # DNS cache TTL
         use_dns_cache=True,
-        keepalive_timeout=30,
+        keepalive_timeout=75,
         enable_cleanup_closed=True,
         force_close=False,  # Reuse connections
     )
@@ -213,6 +319,23 @@ def create_github_session() -> aiohttp.ClientSession:
         headers={"User-Agent": "GitHub-Explorer-Bot/2.0"},
     )
 
+# Shared session, created on first use so connections are kept alive across requests
+_shared_session: Optional[aiohttp.ClientSession] = None
+
+def get_github_session() -> aiohttp.ClientSession:
+    """Get the shared GitHub session, creating it if needed"""
+    global _shared_session
+    if _shared_session is None or _shared_session.closed:
+        _shared_session = create_github_session()
+    return _shared_session
+
+async def close_github_session():
+    """Close the shared GitHub session (call on bot shutdown)"""
+    global _shared_session
+    if _shared_session is not None and not _shared_session.closed:
+        await _shared_session.close()
+    _shared_session = None
+
 # Main API functions
 async def fetch_repo_info(session: aiohttp.ClientSession, repo: str) -> Optional[Dict]:
     """Fetch repository information from GitHub API"""
@@ -333,18 +456,11 @@ async def fetch_readme(session: aiohttp.ClientSession, repo: str) -> Optional[st
         return None
 
     try:
-        data = await _make_request_with_retry(session, f"/repos/{repo}/readme", timeout=6)
-
-        if not data or "content" not in data:
-            return None
-
-        # Decode base64 content
-        try:
-            content = base64.b64decode(data["content"]).decode("utf-8")
-            return content
-        except Exception as e:
-            logger.error(f"Failed to decode README content for {repo}: {e}")
-            return None
+        # Plain text avoids base64 inflation over the wire and the decode step
+        content = await _make_request_with_retry(
+            session, f"/repos/{repo}/readme", timeout=6, accept=RAW_MEDIA_TYPE
+        )
+        return content or None
 
     except (NotFoundError, NetworkError, GitHubAPIError) as e:
         logger.error(f"Failed to fetch README for {repo}: {e}")
@@ -1,7 +1,9 @@
 import asyncio
+import contextlib
 from telegram import InlineKeyboardMarkup
 from telegram.error import BadRequest
 import logging
+from utils.rate_limit import edit_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +13,7 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_ANIMATION = "bounce"
 ANIMATION_SPEED = 0.7
+FAST_RESPONSE_THRESHOLD = 0.25  # Seconds a fetch may take before loading is shown
 
 class LoadingAnimation:
     def __init__(self):
@@ -119,9 +122,10 @@ class LoadingAnimation:
                 # Replace tip line
                 animated_text = self._replace_tip_line(original_text, loading_line)
 
-                # Update message
+                # Update message, skipping the frame if edits are being throttled
                 try:
-                    await message.edit_text(
+                    await edit_limiter.edit_if_free(
+                        message,
                         animated_text,
                         parse_mode="Markdown",
                         reply_markup=(
@@ -168,9 +172,10 @@ class LoadingAnimation:
         # Replace tip line
         loading_text = self._replace_tip_line(original_text, loading_line)
 
-        # Update message
+        # Update message (purely cosmetic, so skipped when edits are throttled)
         try:
-            await message.edit_text(
+            await edit_limiter.edit_if_free(
+                message,
                 loading_text,
                 parse_mode="Markdown",
                 reply_markup=(
@@ -228,6 +233,45 @@ async def show_static_loading(
         message, title, action, page, preserve_content, animation_type
     )
 
+async def stop_loading(loading_task):
+    """Cancel a loading animation task and wait for it to finish"""
+    if loading_task and not loading_task.done():
+        loading_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await loading_task
+
+@contextlib.asynccontextmanager
+async def loading(message, title, action="Loading", page=None, animation_type=None):
+    """Show animated loading for the duration of the block"""
+    # The first animation frame is the static frame, so let the task draw it
+    # rather than awaiting a separate edit before the block starts running
+    loading_task = await show_loading(message, title, action, page, animation_type)
+
+    try:
+        yield
+    finally:
+        # Stop loading animation gracefully, even if the block raised
+        await stop_loading(loading_task)
+
+async def fetch_with_loading(
+    fetch, message, title, action="Loading", page=None, animation_type=None
+):
+    """Await a fetch, showing loading animation only if it does not finish quickly"""
+    fetch_task = asyncio.ensure_future(fetch)
+
+    try:
+        done, _ = await asyncio.wait({fetch_task}, timeout=FAST_RESPONSE_THRESHOLD)
+    except asyncio.CancelledError:
+        fetch_task.cancel()
+        raise
+
+    # Fast (usually cached) responses skip the loading edits entirely
+    if done:
+        return fetch_task.result()
+
+    async with loading(message, title, action, page, animation_type):
+        return await fetch_task
+
 async def show_error(
     message,
     title,
@@ -0,0 +1,225 @@
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict, deque
+from datetime import timedelta
+from telegram.error import RetryAfter
+from telegram.ext import BaseRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# ═══════════════════════════════════════════════════════════════════
+#                    TELEGRAM EDIT RATE LIMITING
+# ═══════════════════════════════════════════════════════════════════
+
+GLOBAL_EDITS_PER_SECOND = 30
+GROUP_EDITS_PER_MINUTE = 20  # Telegram's per-chat limit only applies to groups and channels
+MAX_EDIT_WAIT = 3  # Seconds an edit may wait for a slot; updates are handled one at a time
+MAX_TRACKED_CHATS = 1000
+MAX_TRACKED_MESSAGES = 1000
+RESERVED_EDITS = 5  # Slots per window that droppable edits (animation frames) may not use
+
+# Bot API methods that edit an existing message
+EDIT_ENDPOINTS = frozenset({
+    "editMessageText",
+    "editMessageCaption",
+    "editMessageMedia",
+    "editMessageReplyMarkup",
+})
+
+# rate_limit_args marking an edit that is dropped instead of queued when no slot is free
+DROP_IF_BUSY = "drop_if_busy"
+
+
+class EditSkipped(Exception):
+    """A droppable edit was not sent because no edit slot was free"""
+    pass
+
+
+def _is_group(chat_id):
+    """Whether chat_id is a group or channel (negative ids and @usernames)"""
+    try:
+        return int(chat_id) < 0
+    except (TypeError, ValueError):
+        return isinstance(chat_id, str)
+
+
+def _edit_content(endpoint, data):
+    """What an edit would show, or None when it can't be compared (media edits)"""
+    if endpoint == "editMessageMedia":
+        return None
+    markup = data.get("reply_markup")
+    if hasattr(markup, "to_dict"):
+        markup = markup.to_dict()
+    return (data.get("text"), data.get("caption"), data.get("parse_mode"), markup)
+
+
+class EditRateLimiter(BaseRateLimiter):
+    """Keep message edits under Telegram's flood limits instead of hitting RetryAfter
+
+    Installed as the application's rate limiter, so every edit made through the
+    bot is counted, whichever handler makes it. Other requests pass straight through.
+    Edits never wait more than MAX_EDIT_WAIT, so a full window can't stall the
+    sequential update processing for everyone.
+    """
+
+    def __init__(self, per_second=GLOBAL_EDITS_PER_SECOND, per_group_per_minute=GROUP_EDITS_PER_MINUTE):
+        self.per_second = per_second
+        self.per_group_per_minute = per_group_per_minute
+        self._global = deque()
+        self._chats = {}  # group chat id -> times of its edits in the last minute
+        self._resume_at = 0.0  # Set when Telegram tells us to back off
+        self._shown = OrderedDict()  # message key -> content of the last edit sent
+        self._queued = {}  # message key -> ticket of the newest edit waiting for a slot
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
+
+    def _wait_time(self, chat_id, now, reserve=0):
+        """Seconds until an edit to chat_id fits in its windows (0 if it fits now)"""
+        if now < self._resume_at:
+            return self._resume_at - now
+
+        sent = self._global
+        while sent and now - sent[0] >= 1:
+            sent.popleft()
+
+        wait = 0.0
+        if len(sent) >= self.per_second - reserve:
+            wait = 1 - (now - sent[0])
+        if not _is_group(chat_id):
+            return wait
+
+        chat_sent = self._chats.get(chat_id)
+        if chat_sent is None:
+            if len(self._chats) >= MAX_TRACKED_CHATS:
+                self._forget_idle_chats(now)
+            chat_sent = self._chats[chat_id] = deque()
+        while chat_sent and now - chat_sent[0] >= 60:
+            chat_sent.popleft()
+
+        if len(chat_sent) >= self.per_group_per_minute - reserve:
+            wait = max(wait, 60 - (now - chat_sent[0]))
+        return wait
+
+    def _forget_idle_chats(self, now):
+        """Drop group chats with no edits in the last minute"""
+        for chat_id in [c for c, sent in self._chats.items() if not sent or now - sent[-1] >= 60]:
+            del self._chats[chat_id]
+
+    def _record(self, chat_id, now):
+        self._global.append(now)
+        if _is_group(chat_id):
+            self._chats[chat_id].append(now)
+
+    def try_acquire(self, chat_id):
+        """Reserve an edit slot if one is free right now (for droppable edits)"""
+        now = time.monotonic()
+        # Leave a few slots free so the final result edit is never queued behind frames
+        if self._wait_time(chat_id, now, RESERVED_EDITS) > 0:
+            return False
+        self._record(chat_id, now)
+        return True
+
+    async def acquire(self, chat_id, key=None):
+        """Wait up to MAX_EDIT_WAIT for an edit slot and reserve it
+
+        An edit that would have to wait longer is let through, leaving the final
+        say to Telegram, except during a flood control pause, which raises
+        RetryAfter. With a message key, returns False without reserving a slot
+        if a newer edit of the same message arrives while this one is waiting.
+        """
+        ticket = object()
+        if key is not None:
+            self._queued[key] = ticket
+        deadline = time.monotonic() + MAX_EDIT_WAIT
+        try:
+            while True:
+                now = time.monotonic()
+                wait = self._wait_time(chat_id, now)
+                if now + wait > deadline:
+                    if now < self._resume_at:
+                        raise RetryAfter(math.ceil(self._resume_at - now))
+                    wait = 0
+                if wait <= 0:
+                    self._record(chat_id, now)
+                    return True
+                await asyncio.sleep(wait)
+                if key is not None and self._queued.get(key) is not ticket:
+                    return False
+        finally:
+            if key is not None and self._queued.get(key) is ticket:
+                del self._queued[key]
+
+    def _back_off(self, error):
+        """Pause all edits for as long as Telegram asked"""
+        retry_after = error.retry_after
+        if isinstance(retry_after, timedelta):
+            retry_after = retry_after.total_seconds()
+        self._resume_at = max(self._resume_at, time.monotonic() + retry_after)
+        logger.warning(f"Telegram flood control, pausing edits for {retry_after}s")
+        return retry_after
+
+    def _remember(self, key, content):
+        """Record what a message shows after an edit, evicting the least recently used"""
+        self._shown[key] = content
+        self._shown.move_to_end(key)
+        if len(self._shown) > MAX_TRACKED_MESSAGES:
+            self._shown.popitem(last=False)
+
+    async def process_request(self, callback, args, kwargs, endpoint, data, rate_limit_args):
+        """Send a bot request, holding edits until the limits allow them"""
+        if endpoint not in EDIT_ENDPOINTS:
+            return await callback(*args, **kwargs)
+
+        chat_id = data.get("chat_id")
+        key = (chat_id, data.get("message_id"), data.get("inline_message_id"))
+        content = _edit_content(endpoint, data)
+
+        # Telegram would only answer "message is not modified", so don't spend a slot on it
+        if content is not None and self._shown.get(key) == content:
+            return True
+
+        droppable = rate_limit_args == DROP_IF_BUSY
+        if droppable:
+            if not self.try_acquire(chat_id):
+                raise EditSkipped()
+        elif not await self.acquire(chat_id, key):
+            # A newer edit of this message replaces this one, so it is never sent
+            return True
+
+        try:
+            result = await callback(*args, **kwargs)
+        except RetryAfter as e:
+            retry_after = self._back_off(e)
+            if droppable:
+                raise EditSkipped() from e
+            if retry_after > MAX_EDIT_WAIT:
+                raise
+            await self.acquire(chat_id)
+            result = await callback(*args, **kwargs)
+
+        self._remember(key, content)
+        return result
+
+    async def edit_if_free(self, message, text, **kwargs):
+        """Edit a message only if a slot is free now; returns False if the edit was skipped"""
+        try:
+            await message.get_bot().edit_message_text(
+                text,
+                chat_id=message.chat_id,
+                message_id=message.message_id,
+                rate_limit_args=DROP_IF_BUSY,
+                **kwargs,
+            )
+        except EditSkipped:
+            return False
+        return True
+
+
+# Create global instance
+edit_limiter = EditRateLimiter()